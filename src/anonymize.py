@@ -11,45 +11,121 @@ All other lab members are anonymized as R1, R2, R3, etc.
 
 The actual name-to-pseudonym mapping is loaded from ``name_mapping.json``,
 which is gitignored to protect researcher identities. See
-``name_mapping.example.json`` for the expected format.
+``name_mapping.example.json`` for the expected format. Running
+``freeze_name_mapping.py`` bakes the mapping and its derived lookup
+tables into ``_name_mapping_gen.py`` (also gitignored); when that module
+is present it is imported instead, skipping the JSON load.
 
 Author: Matt Akamatsu (with Claude)
 Date: 2026-02-12
 """
 
-import json
+import re
+import sys
+from functools import cache, lru_cache
 from pathlib import Path
 
+from io_utils import load_json_file
+
+__all__ = [
+    'NAME_TO_PSEUDONYM',
+    'anonymize_name',
+    'anonymize_title',
+    'anonymize_dict',
+    'refresh',
+]
+
+try:
+    import _name_mapping_gen as _frozen
+except ImportError:
+    _frozen = None
+
 _MAPPING_PATH = Path(__file__).parent / 'name_mapping.json'
 
+# A frozen module older than name_mapping.json would miss names added since
+# the last freeze and let them through unanonymized; use the JSON instead
+if _frozen is not None and _MAPPING_PATH.exists():
+    if _MAPPING_PATH.stat().st_mtime_ns > Path(_frozen.__file__).stat().st_mtime_ns:
+        _frozen = None
+
+# (st_mtime_ns, mapping) of the last successful load
+_MAPPING_CACHE = None
+
 
 def _load_mapping() -> dict:
-    """Load the name-to-pseudonym mapping from the JSON file."""
+    """
+    Load the name-to-pseudonym mapping from the JSON file.
+
+    The parsed mapping is cached against the file's modification time, so
+    refresh() only re-reads the file when it has actually changed.
+    Names and pseudonyms are interned, so every occurrence of e.g. 'R1'
+    handed out by this module is the same string object, and the lookup
+    table shares its key strings with the rest of the interpreter.
+    """
+    global _MAPPING_CACHE
+
     if not _MAPPING_PATH.exists():
         raise FileNotFoundError(
             f"Name mapping file not found: {_MAPPING_PATH}\n"
             f"Copy name_mapping.example.json to name_mapping.json and fill in real names."
         )
-    with open(_MAPPING_PATH) as f:
-        return json.load(f)
+    mtime = _MAPPING_PATH.stat().st_mtime_ns
+    if _MAPPING_CACHE is not None and _MAPPING_CACHE[0] == mtime:
+        return _MAPPING_CACHE[1]
+
+    mapping = load_json_file(_MAPPING_PATH)
+    mapping = {
+        sys.intern(name): sys.intern(pseudonym)
+        for name, pseudonym in mapping.items()
+    }
+    _MAPPING_CACHE = (mtime, mapping)
+    return mapping
 
 
 # Mapping from real names to pseudonyms
 # PI stays identified; all others anonymized
-NAME_TO_PSEUDONYM = _load_mapping()
+NAME_TO_PSEUDONYM = _frozen.NAME_TO_PSEUDONYM if _frozen else _load_mapping()
+
+
+@cache
+def _pseudonym_to_name() -> dict:
+    """
+    Reverse mapping for reference (pseudonym -> real name).
+
+    NOT used in pipeline outputs; only for internal reference. Built on
+    first use rather than at import.
+    """
+    return {v: k for k, v in NAME_TO_PSEUDONYM.items()
+            if v != k}  # Exclude PI (identity preserved)
+
+
+def _build_last_name_index() -> dict:
+    """
+    Build a last-name -> pseudonym index for matching variant spellings.
+
+    Only multi-word full names contribute; if two full names share a last
+    name, the first one in the mapping wins. Insertion order follows the
+    mapping, which is the order anonymize_name tries the last names in.
+    """
+    result = {}
+    for full_name, pseudonym in NAME_TO_PSEUDONYM.items():
+        parts = full_name.split()
+        if len(parts) >= 2:
+            result.setdefault(parts[-1], pseudonym)
+    return result
 
-# Reverse mapping for reference (pseudonym -> real name)
-# NOT used in pipeline outputs; only for internal reference
-_PSEUDONYM_TO_NAME = {v: k for k, v in NAME_TO_PSEUDONYM.items()
-                      if v != k}  # Exclude PI (identity preserved)
 
+_LAST_NAME_INDEX = _frozen.LAST_NAME_INDEX if _frozen else _build_last_name_index()
 
+
+@lru_cache(maxsize=4096)
 def anonymize_name(name: str) -> str:
     """
     Return the anonymized pseudonym for a researcher name.
 
     If the name is not in the mapping, returns the original name unchanged.
-    Returns None if input is None.
+    Returns None if input is None. Results are memoized; call
+    ``anonymize_name.cache_clear()`` if NAME_TO_PSEUDONYM is changed.
 
     Args:
         name: Real researcher name
@@ -59,16 +135,20 @@ def anonymize_name(name: str) -> str:
     """
     if name is None:
         return None
-    name = name.strip()
 
-    # Check exact match first
-    if name in NAME_TO_PSEUDONYM:
-        return NAME_TO_PSEUDONYM[name]
-
-    # Try partial match on last name for variant spellings
-    for full_name, pseudonym in NAME_TO_PSEUDONYM.items():
-        parts = full_name.split()
-        if len(parts) >= 2 and parts[-1] in name:
+    # Check exact match first (before strip, since inputs are usually clean)
+    pseudonym = NAME_TO_PSEUDONYM.get(name)
+    if pseudonym is not None:
+        return pseudonym
+    name = name.strip()
+    pseudonym = NAME_TO_PSEUDONYM.get(name)
+    if pseudonym is not None:
+        return pseudonym
+
+    # Try partial match on last name for variant spellings ("Doe, Jane",
+    # "Rao's", "M.Akamatsu"): any substring, in mapping order
+    for last_name, pseudonym in _LAST_NAME_INDEX.items():
+        if last_name in name:
             return pseudonym
 
     return name
@@ -114,6 +194,70 @@ def _build_first_name_map() -> dict:
     return result
 
 
+# First-name/nickname fragments, derived once from NAME_TO_PSEUDONYM
+_FIRST_NAME_MAP = _frozen.FIRST_NAME_MAP if _frozen else _build_first_name_map()
+
+
+def _build_title_replacements() -> dict:
+    """
+    Build the combined fragment -> replacement table used by anonymize_title.
+
+    Every full name is included, so all of them are found by the same
+    single scan as the first-name/nickname fragments in _FIRST_NAME_MAP.
+    Identity-mapped names (the PI) map to themselves: they are matched as
+    a whole and left intact instead of having a first-name fragment
+    replaced inside them.
+    """
+    result = dict(NAME_TO_PSEUDONYM)
+    for fragment, replacement in _FIRST_NAME_MAP.items():
+        result.setdefault(fragment, replacement)
+    return result
+
+
+def _compile_title_pattern(replacements: dict):
+    """
+    Compile all replacement fragments into one alternation regex.
+
+    Fragments are sorted longest-first so a full name always wins over a
+    first-name fragment starting at the same position. Returns None when
+    there is nothing to replace.
+    """
+    if not replacements:
+        return None
+    fragments = sorted(replacements, key=len, reverse=True)
+    return re.compile('|'.join(re.escape(fragment) for fragment in fragments))
+
+
+def _compile_title_filter(replacements: dict):
+    """
+    Compile a character class of every fragment's first character.
+
+    A title containing none of these characters cannot contain any
+    fragment, so anonymize_title can return it without running the full
+    alternation. Returns None when there is nothing to replace.
+    """
+    if not replacements:
+        return None
+    initials = sorted({fragment[0] for fragment in replacements})
+    return re.compile('[' + ''.join(re.escape(c) for c in initials) + ']')
+
+
+# Built once at import: a single left-to-right scan replaces every
+# embedded name, instead of one substring scan per fragment per title.
+if _frozen:
+    _TITLE_REPLACEMENTS = _frozen.TITLE_REPLACEMENTS
+    _TITLE_RE = re.compile(_frozen.TITLE_PATTERN) if _frozen.TITLE_PATTERN else None
+else:
+    _TITLE_REPLACEMENTS = _build_title_replacements()
+    _TITLE_RE = _compile_title_pattern(_TITLE_REPLACEMENTS)
+_TITLE_FILTER = _compile_title_filter(_TITLE_REPLACEMENTS)
+
+
+def _replace_title_match(match: re.Match) -> str:
+    """re.sub callback: map a matched fragment to its replacement."""
+    return _TITLE_REPLACEMENTS[match.group(0)]
+
+
 def anonymize_title(title: str) -> str:
     """
     Anonymize researcher names that appear embedded within experiment titles.
@@ -129,19 +273,15 @@ def anonymize_title(title: str) -> str:
     """
     if title is None:
         return None
+    return _anonymize_title_cached(title)
 
-    # Replace full names that might appear in titles
-    for full_name, pseudonym in NAME_TO_PSEUDONYM.items():
-        if full_name in title and full_name != 'Matt Akamatsu':
-            title = title.replace(full_name, pseudonym)
-
-    # Replace first names / nicknames
-    first_name_map = _build_first_name_map()
-    for fragment, replacement in first_name_map.items():
-        if fragment in title:
-            title = title.replace(fragment, replacement)
 
-    return title
+@lru_cache(maxsize=8192)
+def _anonymize_title_cached(title: str) -> str:
+    """Memoized body of anonymize_title (titles recur across figures and bundles)."""
+    if _TITLE_RE is None or not _TITLE_FILTER.search(title):
+        return title
+    return _TITLE_RE.sub(_replace_title_match, title)
 
 
 def anonymize_dict(d: dict, fields: list[str]) -> dict:
@@ -149,16 +289,45 @@ def anonymize_dict(d: dict, fields: list[str]) -> dict:
     Anonymize specified fields in a dictionary.
 
     Creates a shallow copy of the dict with the specified fields anonymized.
+    If none of the fields are present (or all are None), the input dict is
+    returned as-is without copying.
 
     Args:
         d: Dictionary containing researcher names
         fields: List of field names to anonymize
 
     Returns:
-        New dict with specified fields anonymized
+        New dict with specified fields anonymized, or ``d`` itself if
+        there was nothing to anonymize
     """
-    result = dict(d)
-    for field in fields:
-        if field in result and result[field] is not None:
-            result[field] = anonymize_name(result[field])
-    return result
+    updates = {
+        field: anonymize_name(d[field])
+        for field in fields
+        if d.get(field) is not None
+    }
+    if not updates:
+        return d
+    return {**d, **updates}
+
+
+def refresh() -> None:
+    """
+    Reload ``name_mapping.json`` and rebuild all derived lookup tables.
+
+    Only needed if the mapping file changes while the process is running;
+    the tables are otherwise built once at import. Always reads the JSON
+    file, even when a frozen ``_name_mapping_gen.py`` was imported.
+    """
+    global NAME_TO_PSEUDONYM, _LAST_NAME_INDEX
+    global _FIRST_NAME_MAP, _TITLE_REPLACEMENTS, _TITLE_RE, _TITLE_FILTER
+
+    NAME_TO_PSEUDONYM = _load_mapping()
+    _LAST_NAME_INDEX = _build_last_name_index()
+    _FIRST_NAME_MAP = _build_first_name_map()
+    _TITLE_REPLACEMENTS = _build_title_replacements()
+    _TITLE_RE = _compile_title_pattern(_TITLE_REPLACEMENTS)
+    _TITLE_FILTER = _compile_title_filter(_TITLE_REPLACEMENTS)
+
+    _pseudonym_to_name.cache_clear()
+    anonymize_name.cache_clear()
+    _anonymize_title_cached.cache_clear()
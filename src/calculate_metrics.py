@@ -13,14 +13,28 @@ Author: Matt Akamatsu (with Claude)
 Date: 2026-01-25
 """
 
-import json
+import gzip
+import statistics
 from datetime import datetime, timezone
 from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+from io_utils import ORJSON_AVAILABLE, dumps, write_atomic
 from parse_jsonld import analyze_graph, parse_date
 
+try:
+    import ujson
+    UJSON_AVAILABLE = True
+except ImportError:
+    UJSON_AVAILABLE = False
+
+BASE_PATH = Path(__file__).resolve().parent.parent
+OUTPUT_DIR = BASE_PATH / 'output'
+DEFAULT_JSONLD_PATH = BASE_PATH / 'graph raw data' / 'akamatsulab_discourse-graph-json-LD_202601242232.json'
+DEFAULT_ROAM_PATH = BASE_PATH / 'graph raw data' / 'akamatsulab-whole-graph-json-2026-01-24-23-44-15.json'
+
 
 def normalize_datetime(dt: Optional[datetime]) -> Optional[datetime]:
     """
@@ -33,14 +47,45 @@ def normalize_datetime(dt: Optional[datetime]) -> Optional[datetime]:
         # Convert to UTC then make naive
         dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
     return dt
-from parse_roam_json import (
-    analyze_all_experiment_pages,
-    analyze_iss_pages,
-    load_roam_json_streaming,
-    find_block_by_content,
-    get_block_timestamp,
-    validate_roam_export,
-)
+
+
+@lru_cache(maxsize=None)
+def parse_normalized_date(date_str: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an ISO date string and normalize it to a naive UTC datetime.
+
+    Equivalent to normalize_datetime(parse_date(date_str)), memoized so each
+    distinct timestamp string is parsed and converted only once across all
+    merge and RES-linking passes.
+    """
+    return normalize_datetime(parse_date(date_str))
+
+
+from parse_roam_json import analyze_roam_pages
+
+
+def _roam_person(roam_data: dict, field: str, default: Optional[str]) -> Optional[str]:
+    """
+    Return the person from a Roam (person, timestamp) field, else default.
+
+    Roam values are preferred over JSON-LD ones because they come from the
+    block that actually holds the attribute.
+    """
+    value = roam_data.get(field)
+    return value[0] if value else default
+
+
+def _resolve_attribution(candidates: tuple) -> tuple[Optional[str], Optional[str]]:
+    """
+    Resolve a primary contributor from an attribution priority chain.
+
+    Args:
+        candidates: (method, person) pairs in priority order
+
+    Returns:
+        (person, method) for the first pair with a person, else (None, None)
+    """
+    return next(((person, method) for method, person in candidates if person), (None, None))
 
 
 def merge_experiment_data(jsonld_data: dict, roam_timestamps: dict) -> list[dict]:
@@ -54,6 +99,10 @@ def merge_experiment_data(jsonld_data: dict, roam_timestamps: dict) -> list[dict
     for exp in jsonld_data['experiment_pages']:
         title = exp['title']
         roam_data = roam_timestamps.get(title, {})
+        creator = exp.get('creator')
+        has_log = roam_data.get('has_experimental_log', False)
+        log_entry_count = roam_data.get('log_entry_count', 0)
+        first_log_entry = roam_data.get('first_log_entry')
 
         # Determine if this is a claimed issue
         claimed_by = exp.get('claimed_by')
@@ -67,59 +116,42 @@ def merge_experiment_data(jsonld_data: dict, roam_timestamps: dict) -> list[dict
             claim_type = 'explicit'
 
         # Get issue created by
-        issue_created_by = exp.get('issue_created_by')
-        if roam_data.get('issue_created_by'):
-            person, _ = roam_data['issue_created_by']
-            issue_created_by = person
+        issue_created_by = _roam_person(roam_data, 'issue_created_by', exp.get('issue_created_by'))
 
         # Get made_by (Made by:: / Creator:: / Created by::) - highest priority attribution
-        made_by = exp.get('made_by')  # from JSON-LD content
-        if roam_data.get('made_by'):
-            person, _ = roam_data['made_by']
-            made_by = person  # Roam data preferred (has block-level info)
+        made_by = _roam_person(roam_data, 'made_by', exp.get('made_by'))
 
         # Get author (Author::) - lowest priority fallback
-        author = exp.get('author')  # from JSON-LD content
-        if roam_data.get('author'):
-            person, _ = roam_data['author']
-            author = person
+        author = _roam_person(roam_data, 'author', exp.get('author'))
 
         # Infer self-claim: if no Claimed By field but has experimental log
         # with content, the page creator is effectively self-claiming
-        if not claimed_by and roam_data.get('has_experimental_log', False):
-            if roam_data.get('log_entry_count', 0) > 0 and exp.get('creator'):
-                claimed_by = exp['creator']
+        if not claimed_by and has_log:
+            if log_entry_count > 0 and creator:
+                claimed_by = creator
                 # Use first log entry as claim timestamp
-                if roam_data.get('first_log_entry'):
-                    claimed_by_timestamp = roam_data['first_log_entry']
+                if first_log_entry:
+                    claimed_by_timestamp = first_log_entry
                 # Also infer issue_created_by as creator if not set
                 if not issue_created_by:
-                    issue_created_by = exp['creator']
+                    issue_created_by = creator
                 claim_type = 'inferred'
 
         # Resolve primary_contributor using priority chain:
         # Made by/Creator/Created by > Claimed By > Author > JSON-LD creator
-        primary_contributor = None
-        attribution_method = None
-        if made_by:
-            primary_contributor = made_by
-            attribution_method = 'made_by'
-        elif claimed_by:
-            primary_contributor = claimed_by
-            attribution_method = 'claimed_by'
-        elif author:
-            primary_contributor = author
-            attribution_method = 'author'
-        elif exp.get('creator'):
-            primary_contributor = exp['creator']
-            attribution_method = 'creator'
+        primary_contributor, attribution_method = _resolve_attribution((
+            ('made_by', made_by),
+            ('claimed_by', claimed_by),
+            ('author', author),
+            ('creator', creator),
+        ))
 
         # Page creation date (= Issue creation date for converted issues)
         # Use the earliest of: JSON-LD created, Roam page created, earliest block timestamp
         # This handles cases where pages were merged and the page create-time was updated
         page_created_candidates = []
         if exp.get('created'):
-            jsonld_created = normalize_datetime(parse_date(exp['created']))
+            jsonld_created = parse_normalized_date(exp['created'])
             if jsonld_created:
                 page_created_candidates.append(jsonld_created)
         if roam_data.get('page_created'):
@@ -140,7 +172,7 @@ def merge_experiment_data(jsonld_data: dict, roam_timestamps: dict) -> list[dict
         merged.append({
             'uid': exp['uid'],
             'title': title,
-            'creator': exp.get('creator'),
+            'creator': creator,
             'page_created': page_created,
             'claimed_by': claimed_by,
             'claimed_by_timestamp': claimed_by_timestamp,
@@ -151,10 +183,10 @@ def merge_experiment_data(jsonld_data: dict, roam_timestamps: dict) -> list[dict
             'attribution_method': attribution_method,
             'claim_type': claim_type,  # 'explicit', 'inferred', or None
             'status': exp.get('status'),
-            'has_experimental_log': roam_data.get('has_experimental_log', False),
-            'first_log_entry': roam_data.get('first_log_entry'),
-            'log_entry_count': roam_data.get('log_entry_count', 0),
-            'is_claimed': bool(claimed_by) or roam_data.get('has_experimental_log', False),
+            'has_experimental_log': has_log,
+            'first_log_entry': first_log_entry,
+            'log_entry_count': log_entry_count,
+            'is_claimed': bool(claimed_by) or has_log,
         })
 
     return merged
@@ -174,7 +206,7 @@ def merge_iss_data(jsonld_data: dict, roam_iss_data: dict) -> list[dict]:
 
         page_created = None
         if iss.get('created'):
-            page_created = normalize_datetime(parse_date(iss['created']))
+            page_created = parse_normalized_date(iss['created'])
         elif roam_data.get('page_created'):
             page_created = normalize_datetime(roam_data['page_created'])
 
@@ -182,27 +214,15 @@ def merge_iss_data(jsonld_data: dict, roam_iss_data: dict) -> list[dict]:
         first_log = normalize_datetime(roam_data.get('first_log_entry'))
 
         # Get made_by and author from both sources
-        made_by = iss.get('made_by')
-        if roam_data.get('made_by'):
-            person, _ = roam_data['made_by']
-            made_by = person
-        author_val = iss.get('author')
-        if roam_data.get('author'):
-            person, _ = roam_data['author']
-            author_val = person
+        made_by = _roam_person(roam_data, 'made_by', iss.get('made_by'))
+        author_val = _roam_person(roam_data, 'author', iss.get('author'))
 
         # Resolve primary_contributor
-        primary_contributor = None
-        attribution_method = None
-        if made_by:
-            primary_contributor = made_by
-            attribution_method = 'made_by'
-        elif author_val:
-            primary_contributor = author_val
-            attribution_method = 'author'
-        elif iss.get('creator'):
-            primary_contributor = iss['creator']
-            attribution_method = 'creator'
+        primary_contributor, attribution_method = _resolve_attribution((
+            ('made_by', made_by),
+            ('author', author_val),
+            ('creator', iss.get('creator')),
+        ))
 
         merged.append({
             'uid': iss['uid'],
@@ -233,42 +253,51 @@ def calculate_conversion_rate(experiments: list[dict], iss_nodes: list[dict]) ->
 
     Total issues = Claimed + Unclaimed ISS pages
     """
-    # Experiment pages with Claimed By (explicit or inferred) = converted issues
-    claimed_experiments = [e for e in experiments if e['claimed_by']]
-    explicit_claims = [e for e in claimed_experiments if e.get('claim_type') == 'explicit']
-    inferred_claims = [e for e in claimed_experiments if e.get('claim_type') == 'inferred']
-
-    # ISS pages with experimental log = informally claimed
-    iss_with_log = [i for i in iss_nodes if i['has_experimental_log']]
-
+    # Single pass over experiments:
+    # Experiment pages with Claimed By (explicit or inferred) = converted issues,
+    # split by claim type and by cross-person vs self-claiming
+    claimed_experiments = []
+    cross_person_claims = []
+    self_claims = []
+    explicit_claims = 0
+    inferred_claims = 0
+    for e in experiments:
+        claimed_by = e['claimed_by']
+        if not claimed_by:
+            continue
+        claimed_experiments.append(e)
+
+        claim_type = e.get('claim_type')
+        if claim_type == 'explicit':
+            explicit_claims += 1
+        elif claim_type == 'inferred':
+            inferred_claims += 1
+
+        issue_created_by = e['issue_created_by']
+        if issue_created_by:
+            if issue_created_by != claimed_by:
+                cross_person_claims.append(e)
+            else:
+                self_claims.append(e)
+
+    # ISS pages with experimental log = informally claimed;
     # Unclaimed ISS = no experimental log
-    unclaimed_iss = [i for i in iss_nodes if not i['has_experimental_log']]
+    iss_with_log = sum(1 for i in iss_nodes if i['has_experimental_log'])
+    unclaimed_iss = len(iss_nodes) - iss_with_log
 
-    total_claimed = len(claimed_experiments) + len(iss_with_log)
-    total_issues = total_claimed + len(unclaimed_iss)
+    total_claimed = len(claimed_experiments) + iss_with_log
+    total_issues = total_claimed + unclaimed_iss
 
     conversion_rate = (total_claimed / total_issues * 100) if total_issues > 0 else 0
 
-    # Cross-person vs self-claiming
-    cross_person_claims = [
-        e for e in claimed_experiments
-        if e['issue_created_by'] and e['claimed_by']
-        and e['issue_created_by'] != e['claimed_by']
-    ]
-    self_claims = [
-        e for e in claimed_experiments
-        if e['issue_created_by'] and e['claimed_by']
-        and e['issue_created_by'] == e['claimed_by']
-    ]
-
     return {
         'conversion_rate_percent': round(conversion_rate, 1),
         'total_claimed': total_claimed,
         'claimed_experiments': len(claimed_experiments),
-        'explicit_claims': len(explicit_claims),
-        'inferred_claims': len(inferred_claims),
-        'iss_with_activity': len(iss_with_log),
-        'unclaimed_iss': len(unclaimed_iss),
+        'explicit_claims': explicit_claims,
+        'inferred_claims': inferred_claims,
+        'iss_with_activity': iss_with_log,
+        'unclaimed_iss': unclaimed_iss,
         'total_issues': total_issues,
         'cross_person_claims': len(cross_person_claims),
         'self_claims': len(self_claims),
@@ -316,16 +345,18 @@ def calculate_time_to_claim(experiments: list[dict]) -> dict:
             'details': [],
         }
 
-    days_list = [t['days_to_claim'] for t in times_to_claim]
-    days_list_sorted = sorted(days_list)
+    # Sort once; the day counts then come out already ordered
+    details = sorted(times_to_claim, key=lambda x: x['days_to_claim'])
+    days_list = [t['days_to_claim'] for t in details]
 
     return {
-        'count': len(times_to_claim),
+        'count': len(details),
         'avg_days': round(sum(days_list) / len(days_list), 1),
-        'min_days': min(days_list),
-        'max_days': max(days_list),
-        'median_days': days_list_sorted[len(days_list_sorted) // 2],
-        'details': sorted(times_to_claim, key=lambda x: x['days_to_claim']),
+        'min_days': days_list[0],
+        'max_days': days_list[-1],
+        # Upper median, so the value is always an observed whole day count
+        'median_days': statistics.median_high(days_list),
+        'details': details,
     }
 
 
@@ -337,123 +368,223 @@ def _build_relation_map(relation_instances: list[dict], res_uid_set: set) -> dic
     and destination UID -> set of source UIDs that are RES nodes.
     """
     exp_to_res = {}
+    setdefault = exp_to_res.setdefault
     for rel in relation_instances:
-        src = rel.get('source', '').replace('pages:', '')
-        dst = rel.get('destination', '').replace('pages:', '')
+        src = rel.get('source', '').removeprefix('pages:')
+        dst = rel.get('destination', '').removeprefix('pages:')
 
         # If destination is a RES node, map source -> destination
         if dst in res_uid_set:
-            exp_to_res.setdefault(src, set()).add(dst)
+            setdefault(src, set()).add(dst)
         # If source is a RES node, map destination -> source
         if src in res_uid_set:
-            exp_to_res.setdefault(dst, set()).add(src)
+            setdefault(dst, set()).add(src)
 
     return exp_to_res
 
 
+def _find_all(text: str, sub: str) -> list[int]:
+    """Return the start index of every (possibly overlapping) occurrence of sub."""
+    positions = []
+    i = text.find(sub)
+    while i != -1:
+        positions.append(i)
+        i = text.find(sub, i + 1)
+    return positions
+
+
+def _build_res_reference_index(res_nodes: list[dict]) -> dict:
+    """
+    Index RES nodes by every lowercased ``[[...]]`` span in their titles.
+
+    Method 2 of _find_linked_res_nodes looks for ``[[experiment title]]``
+    as a substring of a RES title. Enumerating every span that starts with
+    ``[[`` and ends with ``]]`` turns that scan over all RES nodes into one
+    dict lookup per experiment. Each list keeps res_nodes order.
+    """
+    index = {}
+    for res in res_nodes:
+        res_title = res.get('title', '').lower()
+        ends = [i + 2 for i in _find_all(res_title, ']]')]
+        spans = {
+            res_title[start:end]
+            for start in _find_all(res_title, '[[')
+            for end in ends
+            if end - start >= 4
+        }
+        for span in spans:
+            index.setdefault(span, []).append(res)
+    return index
+
+
+# Shingle length for the RES title n-gram index used by Method 3
+_NGRAM_SIZE = 4
+
+
+def _build_title_ngram_index(titles: list[str]) -> dict:
+    """Map every n-gram to the set of positions in titles that contain it."""
+    index = {}
+    for pos, title in enumerate(titles):
+        for k in range(len(title) - _NGRAM_SIZE + 1):
+            index.setdefault(title[k:k + _NGRAM_SIZE], set()).add(pos)
+    return index
+
+
+def _substring_candidates(query: str, ngram_index: dict) -> list[int]:
+    """
+    Return positions of titles that may contain query, in ascending order.
+
+    Uses the posting list of the rarest n-gram in query; callers still
+    confirm each candidate with a substring test. Query must be at least
+    _NGRAM_SIZE characters long.
+    """
+    rarest = None
+    for k in range(len(query) - _NGRAM_SIZE + 1):
+        postings = ngram_index.get(query[k:k + _NGRAM_SIZE])
+        if not postings:
+            return []
+        if rarest is None or len(postings) < len(rarest):
+            rarest = postings
+    return sorted(rarest)
+
+
+def _enrich_res_node(res: dict) -> Optional[dict]:
+    """
+    Build the linked-RES record for a RES node, or None if it has no
+    parseable creation date (such nodes are never linked).
+    """
+    res_created = parse_normalized_date(res.get('created'))
+    if not res_created:
+        return None
+    pc, pc_method = _resolve_attribution((
+        ('made_by', res.get('made_by')),
+        ('author', res.get('author')),
+        ('creator', res.get('creator')),
+    ))
+    return {
+        'uid': res['uid'],
+        'title': res['title'],
+        'created': res_created,
+        'creator': res.get('creator'),
+        'made_by': res.get('made_by'),
+        'author': res.get('author'),
+        'primary_contributor': pc,
+        'attribution_method': pc_method,
+    }
+
+
 def _find_linked_res_nodes(
     exp: dict,
-    res_nodes: list[dict],
-    res_by_uid: dict,
+    res_titles_lower: list[tuple[dict, str]],
+    res_enriched: dict,
     relation_map: dict,
+    res_by_reference: dict,
+    res_by_ngram: dict,
 ) -> list[dict]:
     """
     Find RES nodes linked to an experiment, using relation instances first
     and falling back to full title matching.
-    """
-    linked_res = []
-    seen_uids = set()
-
-    # Helper to resolve primary_contributor for a RES node
-    def _res_primary_contributor(res):
-        made_by = res.get('made_by')
-        author = res.get('author')
-        creator = res.get('creator')
-        if made_by:
-            return made_by, 'made_by'
-        elif author:
-            return author, 'author'
-        elif creator:
-            return creator, 'creator'
-        return None, None
 
+    res_titles_lower pairs each RES node with its lowercased title,
+    res_enriched maps RES UIDs to their precomputed linked-RES records
+    (from _enrich_res_node; undated nodes are absent), res_by_reference is
+    the index from _build_res_reference_index(), and res_by_ngram is the
+    n-gram index over the lowercased titles.
+    """
     # Method 1: Use relation instances (most reliable)
     exp_uid = exp.get('uid', '')
-    if exp_uid in relation_map:
-        for res_uid in relation_map[exp_uid]:
-            if res_uid in res_by_uid and res_uid not in seen_uids:
-                res = res_by_uid[res_uid]
-                res_created = normalize_datetime(parse_date(res.get('created')))
-                if res_created:
-                    pc, pc_method = _res_primary_contributor(res)
-                    linked_res.append({
-                        'uid': res['uid'],
-                        'title': res['title'],
-                        'created': res_created,
-                        'creator': res.get('creator'),
-                        'made_by': res.get('made_by'),
-                        'author': res.get('author'),
-                        'primary_contributor': pc,
-                        'attribution_method': pc_method,
-                    })
-                    seen_uids.add(res_uid)
+    linked_res = [
+        res_enriched[res_uid]
+        for res_uid in relation_map.get(exp_uid, ())
+        if res_uid in res_enriched
+    ]
+    if linked_res:
+        return linked_res
+
+    seen_uids = set()
 
     # Method 2: Match [[@experiment/...]] backreference in RES title
     # RES nodes often end with - [[@type/experiment name]] referencing their source experiment
-    if not linked_res:
-        exp_title = exp['title']  # e.g. "@analysis/Report the percentage..."
-        # Look for [[exp_title]] in RES node titles (case-insensitive)
-        exp_ref = f'[[{exp_title}]]'.lower()
-        for res in res_nodes:
+    exp_title = exp['title']  # e.g. "@analysis/Report the percentage..."
+    # Look for [[exp_title]] in RES node titles (case-insensitive)
+    exp_ref = f'[[{exp_title}]]'.lower()
+    for res in res_by_reference.get(exp_ref, ()):
+        if res['uid'] in seen_uids:
+            continue
+        enriched = res_enriched.get(res['uid'])
+        if enriched:
+            linked_res.append(enriched)
+            seen_uids.add(res['uid'])
+    if linked_res:
+        return linked_res
+
+    # Method 3: Fall back to full description matching in title only
+    exp_name = exp_title.replace('@', '').lower()
+    # Split only on the first '/' to separate type prefix from description
+    # (avoids breaking on names like "Arp2/3")
+    exp_short_name = exp_name.split('/', 1)[-1] if '/' in exp_name else exp_name
+
+    # Require full short name match (no truncation), title only to avoid citation false positives
+    if len(exp_short_name) >= 20:
+        for pos in _substring_candidates(exp_short_name, res_by_ngram):
+            res, res_title = res_titles_lower[pos]
             if res['uid'] in seen_uids:
                 continue
-            res_title = res.get('title', '').lower()
-            if exp_ref in res_title:
-                res_created = normalize_datetime(parse_date(res.get('created')))
-                if res_created:
-                    pc, pc_method = _res_primary_contributor(res)
-                    linked_res.append({
-                        'uid': res['uid'],
-                        'title': res['title'],
-                        'created': res_created,
-                        'creator': res.get('creator'),
-                        'made_by': res.get('made_by'),
-                        'author': res.get('author'),
-                        'primary_contributor': pc,
-                        'attribution_method': pc_method,
-                    })
+
+            if exp_short_name in res_title:
+                enriched = res_enriched.get(res['uid'])
+                if enriched:
+                    linked_res.append(enriched)
                     seen_uids.add(res['uid'])
 
-    # Method 3: Fall back to full description matching in title only
-    if not linked_res:
-        exp_name = exp['title'].replace('@', '').lower()
-        # Split only on the first '/' to separate type prefix from description
-        # (avoids breaking on names like "Arp2/3")
-        exp_short_name = exp_name.split('/', 1)[-1] if '/' in exp_name else exp_name
-
-        # Require full short name match (no truncation), title only to avoid citation false positives
-        if len(exp_short_name) >= 20:
-            for res in res_nodes:
-                if res['uid'] in seen_uids:
-                    continue
-                res_title = res.get('title', '').lower()
-
-                if exp_short_name in res_title:
-                    res_created = normalize_datetime(parse_date(res.get('created')))
-                    if res_created:
-                        pc, pc_method = _res_primary_contributor(res)
-                        linked_res.append({
-                            'uid': res['uid'],
-                            'title': res['title'],
-                            'created': res_created,
-                            'creator': res.get('creator'),
-                            'made_by': res.get('made_by'),
-                            'author': res.get('author'),
-                            'primary_contributor': pc,
-                            'attribution_method': pc_method,
-                        })
-                        seen_uids.add(res['uid'])
+    return linked_res
+
+
+def build_res_index(res_nodes: list[dict], relation_instances: list[dict] = None) -> dict:
+    """
+    Build the RES lookup structures shared by the RES-linking metrics.
+
+    Returned dict has:
+    - res_titles_lower: (RES node, lowercased title) pairs, in order
+    - res_enriched: linked-RES records (see _enrich_res_node) keyed by UID
+    - relation_map: output of _build_relation_map()
+    - res_by_reference: output of _build_res_reference_index()
+    - res_by_ngram: n-gram index over the lowercased RES titles
+    - linked_res: per-experiment cache filled in by _linked_res_for()
+
+    Build it once and pass it to calculate_time_to_first_result() and
+    calculate_unique_contributors() so they share the linking work.
+    """
+    res_uid_set = {r['uid'] for r in res_nodes}
+    res_titles_lower = [(r, r.get('title', '').lower()) for r in res_nodes]
+    return {
+        'res_titles_lower': res_titles_lower,
+        'res_enriched': {
+            r['uid']: enriched
+            for r in res_nodes
+            if (enriched := _enrich_res_node(r)) is not None
+        },
+        'relation_map': _build_relation_map(relation_instances or [], res_uid_set),
+        'res_by_reference': _build_res_reference_index(res_nodes),
+        'res_by_ngram': _build_title_ngram_index([t for _, t in res_titles_lower]),
+        'linked_res': {},
+    }
 
+
+def _linked_res_for(exp: dict, res_index: dict) -> list[dict]:
+    """Return _find_linked_res_nodes() for exp, memoized in res_index."""
+    key = (exp.get('uid', ''), exp['title'])
+    linked_res = res_index['linked_res'].get(key)
+    if linked_res is None:
+        linked_res = _find_linked_res_nodes(
+            exp,
+            res_index['res_titles_lower'],
+            res_index['res_enriched'],
+            res_index['relation_map'],
+            res_index['res_by_reference'],
+            res_index['res_by_ngram'],
+        )
+        res_index['linked_res'][key] = linked_res
     return linked_res
 
 
@@ -461,6 +592,7 @@ def calculate_time_to_first_result(
     experiments: list[dict],
     res_nodes: list[dict],
     relation_instances: list[dict] = None,
+    res_index: dict = None,
 ) -> dict:
     """
     Calculate Time-to-First-Result metric.
@@ -469,12 +601,11 @@ def calculate_time_to_first_result(
     (or page creation if claim timestamp not available)
 
     Uses relation instances from JSON-LD for reliable linking,
-    with fallback to full title matching.
+    with fallback to full title matching. Pass a prebuilt res_index (from
+    build_res_index) to reuse lookups and matches across metrics.
     """
-    # Build lookup structures
-    res_uid_set = {r['uid'] for r in res_nodes}
-    res_by_uid = {r['uid']: r for r in res_nodes}
-    relation_map = _build_relation_map(relation_instances or [], res_uid_set)
+    if res_index is None:
+        res_index = build_res_index(res_nodes, relation_instances)
 
     results = []
 
@@ -492,7 +623,7 @@ def calculate_time_to_first_result(
         if not ref_timestamp:
             continue
 
-        linked_res = _find_linked_res_nodes(exp, res_nodes, res_by_uid, relation_map)
+        linked_res = _linked_res_for(exp, res_index)
 
         if not linked_res:
             continue
@@ -530,14 +661,16 @@ def calculate_time_to_first_result(
             'details': [],
         }
 
-    days_list = [r['days_to_first_result'] for r in results]
+    # Sort once; the day counts then come out already ordered
+    details = sorted(results, key=lambda x: x['days_to_first_result'])
+    days_list = [r['days_to_first_result'] for r in details]
 
     return {
-        'count': len(results),
+        'count': len(details),
         'avg_days': round(sum(days_list) / len(days_list), 1),
-        'min_days': min(days_list),
-        'max_days': max(days_list),
-        'details': sorted(results, key=lambda x: x['days_to_first_result']),
+        'min_days': days_list[0],
+        'max_days': days_list[-1],
+        'details': details,
     }
 
 
@@ -545,6 +678,7 @@ def calculate_unique_contributors(
     experiments: list[dict],
     res_nodes: list[dict],
     relation_instances: list[dict] = None,
+    res_index: dict = None,
 ) -> dict:
     """
     Calculate Unique Contributors per Issue Chain.
@@ -553,11 +687,12 @@ def calculate_unique_contributors(
     - Issue creator (Issue Created By)
     - Person claiming the issue (Claimed By)
     - RES node creators
+
+    Pass a prebuilt res_index (from build_res_index) to reuse lookups and
+    matches across metrics.
     """
-    # Build lookup structures for RES matching
-    res_uid_set = {r['uid'] for r in res_nodes}
-    res_by_uid = {r['uid']: r for r in res_nodes}
-    relation_map = _build_relation_map(relation_instances or [], res_uid_set)
+    if res_index is None:
+        res_index = build_res_index(res_nodes, relation_instances)
 
     contributor_data = []
 
@@ -565,31 +700,27 @@ def calculate_unique_contributors(
         if not exp['is_claimed']:
             continue
 
-        contributors = set()
-
-        # Add issue creator
-        if exp.get('issue_created_by'):
-            contributors.add(exp['issue_created_by'])
-
-        # Add claimer
-        if exp.get('claimed_by'):
-            contributors.add(exp['claimed_by'])
-
-        # Add page creator (if different)
-        if exp.get('creator'):
-            contributors.add(exp['creator'])
-
-        # Add primary_contributor (may differ from creator/claimer)
-        if exp.get('primary_contributor'):
-            contributors.add(exp['primary_contributor'])
+        # Issue creator, claimer, page creator and primary_contributor
+        # (which may differ from creator/claimer)
+        contributors = {
+            person
+            for person in (
+                exp.get('issue_created_by'),
+                exp.get('claimed_by'),
+                exp.get('creator'),
+                exp.get('primary_contributor'),
+            )
+            if person
+        }
 
-        # Find linked RES nodes and their creators/primary_contributors
-        linked_res = _find_linked_res_nodes(exp, res_nodes, res_by_uid, relation_map)
-        for res in linked_res:
-            if res.get('creator'):
-                contributors.add(res['creator'])
-            if res.get('primary_contributor'):
-                contributors.add(res['primary_contributor'])
+        # Add linked RES nodes' creators/primary_contributors
+        linked_res = _linked_res_for(exp, res_index)
+        contributors.update(
+            person
+            for res in linked_res
+            for person in (res.get('creator'), res.get('primary_contributor'))
+            if person
+        )
 
         contributor_data.append({
             'title': exp['title'],
@@ -609,16 +740,18 @@ def calculate_unique_contributors(
             'details': [],
         }
 
-    counts = [c['count'] for c in contributor_data]
-    distribution = Counter(counts)
+    # Histogram of contributor counts; the other aggregates are read off it
+    # instead of re-scanning every experiment
+    distribution = dict(sorted(Counter(c['count'] for c in contributor_data).items()))
+    total_contributors = sum(n * k for n, k in distribution.items())
 
-    multi = sum(1 for c in counts if c > 1)
-    single = sum(1 for c in counts if c == 1)
+    multi = sum(k for n, k in distribution.items() if n > 1)
+    single = distribution.get(1, 0)
 
     return {
         'experiments_analyzed': len(contributor_data),
-        'avg_contributors': round(sum(counts) / len(counts), 2),
-        'distribution': dict(sorted(distribution.items())),
+        'avg_contributors': round(total_contributors / len(contributor_data), 2),
+        'distribution': distribution,
         'multi_contributor_count': multi,
         'single_contributor_count': single,
         'details': sorted(contributor_data, key=lambda x: -x['count']),
@@ -665,10 +798,9 @@ def calculate_cross_person_claims(experiments: list[dict]) -> dict:
             })
 
     # Analyze idea exchange patterns
-    exchange_pairs = Counter()
-    for claim in cross_person:
-        pair = (claim['issue_created_by'], claim['claimed_by'])
-        exchange_pairs[pair] += 1
+    exchange_pairs = Counter(
+        (claim['issue_created_by'], claim['claimed_by']) for claim in cross_person
+    )
 
     return {
         'cross_person_count': len(cross_person),
@@ -678,6 +810,8 @@ def calculate_cross_person_claims(experiments: list[dict]) -> dict:
         'idea_exchange_rate': round(
             len(cross_person) / (len(cross_person) + len(self_claims)) * 100, 1
         ) if (len(cross_person) + len(self_claims)) > 0 else 0,
+        # Full ranking (the report and figures use every pair); ranked once
+        # here, so the top-5 summary is just a slice of this list
         'exchange_pairs': [
             {'from': pair[0], 'to': pair[1], 'count': count}
             for pair, count in exchange_pairs.most_common()
@@ -704,18 +838,18 @@ def calculate_all_metrics(
     print("Loading JSON-LD data...")
     jsonld_data = analyze_graph(jsonld_path)
 
-    print("Validating Roam export matches JSON-LD graph...")
-    validation = validate_roam_export(roam_json_path, jsonld_data)
+    # One streaming pass over the Roam export covers experiment pages,
+    # ISS pages and validation; a wrong-graph export raises before any
+    # per-page extraction
+    print("Validating Roam export and analyzing experiment and ISS pages...")
+    roam_pages = analyze_roam_pages(roam_json_path, jsonld_data)
+    roam_exp_data = roam_pages['experiment_pages']
+    roam_iss_data = roam_pages['iss_pages']
+    validation = roam_pages['validation']
     print(f"  Match rate: {validation['match_rate']:.1%} "
           f"({validation['experiment_matches']}/{validation['jsonld_experiment_pages']} experiments, "
           f"{validation['iss_matches']}/{validation['jsonld_iss_nodes']} ISS)")
 
-    print("Analyzing experiment pages in Roam JSON...")
-    roam_exp_data = analyze_all_experiment_pages(roam_json_path)
-
-    print("Analyzing ISS pages in Roam JSON...")
-    roam_iss_data = analyze_iss_pages(roam_json_path)
-
     print("Merging data...")
     experiments = merge_experiment_data(jsonld_data, roam_exp_data)
     iss_nodes = merge_iss_data(jsonld_data, roam_iss_data)
@@ -723,8 +857,10 @@ def calculate_all_metrics(
 
     print("Calculating metrics...")
 
-    # Get relation instances for linking experiments to RES nodes
+    # Get relation instances for linking experiments to RES nodes, and
+    # build the RES lookups once for both RES-linking metrics
     relation_instances = jsonld_data.get('relation_instances', [])
+    res_index = build_res_index(res_nodes, relation_instances)
 
     # Metric 1: Conversion Rate
     conversion = calculate_conversion_rate(experiments, iss_nodes)
@@ -733,10 +869,14 @@ def calculate_all_metrics(
     time_to_claim = calculate_time_to_claim(experiments)
 
     # Metric 3: Time-to-First-Result
-    time_to_result = calculate_time_to_first_result(experiments, res_nodes, relation_instances)
+    time_to_result = calculate_time_to_first_result(
+        experiments, res_nodes, relation_instances, res_index=res_index,
+    )
 
     # Metric 4: Unique Contributors
-    contributors = calculate_unique_contributors(experiments, res_nodes, relation_instances)
+    contributors = calculate_unique_contributors(
+        experiments, res_nodes, relation_instances, res_index=res_index,
+    )
 
     # Metric 5: Cross-Person Claiming
     cross_person = calculate_cross_person_claims(experiments)
@@ -756,8 +896,8 @@ def calculate_all_metrics(
     return {
         'generated': datetime.now().isoformat(),
         'data_sources': {
-            'jsonld': jsonld_path,
-            'roam_json': roam_json_path,
+            'jsonld': str(jsonld_path),
+            'roam_json': str(roam_json_path),
         },
         'summary': {
             'total_experiment_pages': len(experiments),
@@ -776,6 +916,141 @@ def calculate_all_metrics(
     }
 
 
+_JSON_LEAF_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _freeze_datetimes(obj):
+    """
+    Return a copy of obj with every datetime replaced by its ISO string.
+
+    Converting up front lets the encoder run without a default= hook, instead
+    of calling back into Python for each datetime leaf. The input is left
+    untouched since callers keep using the metrics afterwards.
+    """
+    # Dispatch on the exact type first; isinstance() is only needed for
+    # subclasses such as Counter or defaultdict
+    t = type(obj)
+    if t in _JSON_LEAF_TYPES:
+        return obj
+    freeze = _FREEZERS.get(t)
+    if freeze is not None:
+        return freeze(obj)
+    if isinstance(obj, dict):
+        return _freeze_dict(obj)
+    if isinstance(obj, (list, tuple)):
+        return _freeze_list(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return obj
+
+
+def _freeze_dict(d: dict) -> dict:
+    return {k: _freeze_datetimes(v) for k, v in d.items()}
+
+
+def _freeze_list(items) -> list:
+    return [_freeze_datetimes(v) for v in items]
+
+
+_FREEZERS = {
+    dict: _freeze_dict,
+    list: _freeze_list,
+    tuple: _freeze_list,
+    datetime: datetime.isoformat,
+}
+
+
+def _encode_jsonl(records: list) -> bytes:
+    """Encode a list of records as JSON Lines (one compact object per line)."""
+    if not ORJSON_AVAILABLE:
+        records = [_freeze_datetimes(rec) for rec in records]
+    return b''.join(dumps(rec) + b'\n' for rec in records)
+
+
+def split_large_arrays(metrics: dict, output_path, threshold: int) -> dict:
+    """
+    Move large record lists out of the metrics dict into JSON Lines sidecars.
+
+    Walks nested dicts (not lists) and writes any list longer than threshold
+    to ``<output stem>.<dotted.key.path>.jsonl`` next to output_path, so
+    streaming consumers can read it line by line without parsing the whole
+    metrics file. The returned dict has those keys removed and lists them
+    under ``large_field_paths`` (dotted key path -> sidecar file name).
+    The input dict is not modified.
+
+    Args:
+        metrics: Output of calculate_all_metrics()
+        output_path: Path of the main metrics JSON file
+        threshold: Lists with more entries than this are split out
+
+    Returns:
+        Metrics dict to save in place of the original
+    """
+    output_path = Path(output_path)
+    stem = output_path.name.split('.', 1)[0]
+    sidecars = {}
+
+    def walk(d: dict, prefix: str) -> dict:
+        out = {}
+        for key, value in d.items():
+            dotted = f"{prefix}{key}"
+            if isinstance(value, dict):
+                out[key] = walk(value, f"{dotted}.")
+            elif isinstance(value, list) and len(value) > threshold:
+                filename = f"{stem}.{dotted}.jsonl"
+                write_atomic(output_path.parent / filename, _encode_jsonl(value))
+                sidecars[dotted] = filename
+            else:
+                out[key] = value
+        return out
+
+    result = walk(metrics, '')
+    if sidecars:
+        result['large_field_paths'] = sidecars
+    return result
+
+
+def save_metrics(metrics: dict, output_path, pretty: bool = False) -> None:
+    """
+    Write the metrics dict to a JSON file.
+
+    Uses orjson when available, which serializes datetime objects natively.
+    Otherwise datetimes are converted to ISO strings and the result is
+    encoded with ujson if installed, falling back to io_utils.dumps. Every
+    backend writes non-ASCII text as raw UTF-8, so the bytes do not depend
+    on which one is installed.
+    If output_path ends in ``.gz`` the JSON is gzip-compressed (level 1,
+    favouring speed over ratio). The file is written through
+    io_utils.write_atomic, so an interrupted or concurrent run never leaves
+    a truncated metrics file behind.
+
+    Args:
+        metrics: Output of calculate_all_metrics()
+        output_path: Destination file path
+        pretty: Indent the output by 2 spaces. Off by default: compact output
+                is smaller and, without orjson, lets json use its C encoder
+                (indented output goes through the pure-Python one).
+                Pretty-print it later with ``jq .`` or ``python -m json.tool``.
+    """
+    if ORJSON_AVAILABLE:
+        payload = dumps(metrics, pretty)
+    elif UJSON_AVAILABLE:
+        payload = ujson.dumps(
+            _freeze_datetimes(metrics),
+            indent=2 if pretty else 0,
+            ensure_ascii=False,
+            escape_forward_slashes=False,
+        ).encode('utf-8')
+    else:
+        # Encode once and write the bytes in one call, rather than letting
+        # json.dump push each encoder chunk through a TextIOWrapper
+        payload = dumps(_freeze_datetimes(metrics), pretty)
+
+    if str(output_path).endswith('.gz'):
+        payload = gzip.compress(payload, compresslevel=1)
+    write_atomic(output_path, payload)
+
+
 def print_metrics_summary(metrics: dict):
     """Print a human-readable summary of the metrics."""
     print("\n" + "=" * 80)
@@ -848,30 +1123,30 @@ def print_metrics_summary(metrics: dict):
 
 
 if __name__ == '__main__':
-    import sys
-
-    # Default paths
-    base_path = Path(__file__).parent.parent
-    default_jsonld = base_path / 'graph raw data' / 'akamatsulab_discourse-graph-json-LD_202601242232.json'
-    default_roam = base_path / 'graph raw data' / 'akamatsulab-whole-graph-json-2026-01-24-23-44-15.json'
-
-    jsonld_path = sys.argv[1] if len(sys.argv) > 1 else str(default_jsonld)
-    roam_path = sys.argv[2] if len(sys.argv) > 2 else str(default_roam)
-
-    metrics = calculate_all_metrics(jsonld_path, roam_path)
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Calculate issue metrics from the discourse graph exports.')
+    parser.add_argument('jsonld', nargs='?', type=Path, default=DEFAULT_JSONLD_PATH,
+                        help='Path to the JSON-LD export')
+    parser.add_argument('roam', nargs='?', type=Path, default=DEFAULT_ROAM_PATH,
+                        help='Path to the Roam JSON export')
+    parser.add_argument('--gzip', action='store_true',
+                        help='Write metrics_data.json.gz instead of plain JSON')
+    parser.add_argument('--pretty', action='store_true',
+                        help='Indent the JSON output (compact by default)')
+    parser.add_argument('--jsonl-threshold', type=int, default=None, metavar='N',
+                        help='Write record lists longer than N to JSON Lines sidecar files')
+    args = parser.parse_args()
+
+    metrics = calculate_all_metrics(args.jsonld, args.roam)
     print_metrics_summary(metrics)
 
     # Save to file
-    output_path = base_path / 'output' / 'metrics_data.json'
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Convert datetime objects for JSON serialization
-    def json_serializer(obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
-
-    with open(output_path, 'w') as f:
-        json.dump(metrics, f, indent=2, default=json_serializer)
+    output_path = OUTPUT_DIR / ('metrics_data.json.gz' if args.gzip else 'metrics_data.json')
+    if not OUTPUT_DIR.exists():
+        OUTPUT_DIR.mkdir(parents=True)
+    if args.jsonl_threshold is not None:
+        metrics = split_large_arrays(metrics, output_path, args.jsonl_threshold)
+    save_metrics(metrics, output_path, pretty=args.pretty)
 
     print(f"\nMetrics saved to: {output_path}")
@@ -18,14 +18,119 @@ Author: Matt Akamatsu (with Claude)
 Date: 2026-01-27
 """
 
-import csv
-import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
 from anonymize import anonymize_name, anonymize_title
+from io_utils import dumps, write_atomic
+
+
+def _write_json(data: Any, path: Path, pretty: bool = True):
+    """
+    Write data as UTF-8 JSON (non-ASCII kept as-is).
+
+    Encodes with io_utils.dumps and writes through write_atomic.
+
+    Args:
+        data: JSON-serializable object
+        path: Output file path
+        pretty: Indent with 2 spaces (default); False writes compact JSON
+            for large machine-read files
+    """
+    write_atomic(path, dumps(data, pretty))
+
+
+# Chunk size for userspace file copies; bundle figures (notably the
+# animated GIF) run to several MB, and shutil's default is 64 KiB
+_COPY_BUFSIZE = 1 << 20
+
+
+def _copy_file(src: Path, dst: Path):
+    """
+    Copy src to dst along with its metadata, like shutil.copy2.
+
+    Tries os.copy_file_range first, which copies inside the kernel (or
+    reflinks, on filesystems that support it). Where the filesystem refuses
+    an in-kernel copy (e.g. some network mounts) the data goes through
+    userspace in _COPY_BUFSIZE chunks; platforms without copy_file_range
+    use shutil.copy2 and its own native fast paths.
+    """
+    if not hasattr(os, 'copy_file_range'):
+        shutil.copy2(src, dst)
+        return
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    # Some filesystems report 0 instead of failing; redo the
+                    # copy below rather than leave a truncated file
+                    raise OSError('copy_file_range made no progress')
+                remaining -= copied
+    except OSError:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            shutil.copyfileobj(fsrc, fdst, _COPY_BUFSIZE)
+    shutil.copystat(src, dst)
+
+
+def _bundle_dir(output_dir: Path, name: str) -> Path:
+    """Create output_dir/evidence_bundles/<name>/data/ and return the bundle directory."""
+    bundle_dir = output_dir / 'evidence_bundles' / name
+    # Creating data/ with parents=True also creates the bundle directory
+    os.makedirs(bundle_dir / 'data', exist_ok=True)
+    return bundle_dir
+
+
+def _bundle_dates() -> tuple[str, str]:
+    """
+    Return (ISO date, 'Month YYYY') for a bundle's metadata.
+
+    Both come from one datetime.now() snapshot, so the dates written into a
+    bundle cannot disagree.
+    """
+    now = datetime.now()
+    return now.date().isoformat(), now.strftime('%B %Y')
+
+
+def _run_all(tasks: list, max_workers: int = 4):
+    """
+    Run (func, *args) tasks on a thread pool and re-raise the first failure.
+
+    Each task writes its own file, so their file I/O overlaps.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(func, *args) for func, *args in tasks]
+    for future in futures:
+        future.result()
+
+
+# JSON-LD @context shared by every evidence bundle's evidence.jsonld
+_DGE_CONTEXT = {
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "dcterms": "http://purl.org/dc/terms/",
+    "prov": "http://www.w3.org/ns/prov#",
+    "schema": "https://schema.org/",
+    "dgb": "https://discoursegraphs.com/schema/dg_base/",
+    "dge": "https://discoursegraphs.com/schema/dg_evidence/",
+}
+
+# Files in the EVD 5 bundle (in RO-Crate hasPart order) and their media
+# types, shared by the JSON-LD and RO-Crate metadata
+_EVD5_BUNDLE_FILES = {
+    'evidence.jsonld': 'application/ld+json',
+    'fig5_alluvial_flow.png': 'image/png',
+    'fig5_alluvial_flow.html': 'text/html',
+    'fig5_funnel_supplemental.png': 'image/png',
+    'data/funnel_summary.json': 'application/json',
+    'data/experiment_details.csv': 'text/csv',
+    'methods_excerpt.md': 'text/markdown',
+}
 
 
 def create_evd5_bundle(metrics: dict, output_dir: Path, viz_dir: Path) -> Path:
@@ -40,64 +145,88 @@ def create_evd5_bundle(metrics: dict, output_dir: Path, viz_dir: Path) -> Path:
     Returns:
         Path to the created bundle directory
     """
-    bundle_dir = output_dir / 'evidence_bundles' / 'evd5-issue-funnel'
-    bundle_dir.mkdir(parents=True, exist_ok=True)
-    (bundle_dir / 'data').mkdir(exist_ok=True)
-
-    # Copy the primary figure (alluvial flow diagram)
-    alluvial_png = viz_dir / 'handoff_alluvial.png'
-    alluvial_html = viz_dir / 'handoff_alluvial.html'
-    if alluvial_png.exists():
-        shutil.copy2(alluvial_png, bundle_dir / 'fig5_alluvial_flow.png')
-    if alluvial_html.exists():
-        shutil.copy2(alluvial_html, bundle_dir / 'fig5_alluvial_flow.html')
-
-    # Copy the supplemental figure (funnel bar chart)
-    fig_src = viz_dir / 'fig5_funnel.png'
-    if fig_src.exists():
-        shutil.copy2(fig_src, bundle_dir / 'fig5_funnel_supplemental.png')
-
-    # Generate data files
-    _write_funnel_summary(metrics, bundle_dir / 'data' / 'funnel_summary.json')
-    _write_experiment_details(metrics, bundle_dir / 'data' / 'experiment_details.csv')
+    bundle_dir = _bundle_dir(output_dir, 'evd5-issue-funnel')
+
+    # Primary figure (alluvial flow diagram) and supplemental figure
+    # (funnel bar chart), as (source, bundle file name)
+    figure_copies = [
+        (viz_dir / 'handoff_alluvial.png', 'fig5_alluvial_flow.png'),
+        (viz_dir / 'handoff_alluvial.html', 'fig5_alluvial_flow.html'),
+        (viz_dir / 'fig5_funnel.png', 'fig5_funnel_supplemental.png'),
+    ]
 
-    # Generate methods excerpt at bundle root
-    _write_methods_excerpt(output_dir, bundle_dir / 'methods_excerpt.md')
+    # Funnel totals and ratios shared by the data and metadata writers
+    agg = _evd5_aggregates(metrics)
 
-    # Generate JSON-LD metadata
-    _write_evidence_jsonld(metrics, bundle_dir / 'evidence.jsonld')
+    today, month = _bundle_dates()
 
-    # Generate RO-Crate metadata
-    _write_ro_crate_metadata(bundle_dir / 'ro-crate-metadata.json')
+    tasks = [
+        (_copy_file, src, bundle_dir / name)
+        for src, name in figure_copies
+        if src.exists()
+    ]
+    tasks += [
+        # Data files
+        (_write_funnel_summary, metrics, agg, today, bundle_dir / 'data' / 'funnel_summary.json'),
+        (_write_experiment_details, metrics, bundle_dir / 'data' / 'experiment_details.csv'),
+        # Methods excerpt at bundle root
+        (_write_methods_excerpt, output_dir, bundle_dir / 'methods_excerpt.md'),
+        # JSON-LD and RO-Crate metadata
+        (_write_evidence_jsonld, metrics, agg, today, month, bundle_dir / 'evidence.jsonld'),
+        (_write_ro_crate_metadata, bundle_dir / 'ro-crate-metadata.json'),
+    ]
+    _run_all(tasks)
 
     print(f"Evidence bundle created: {bundle_dir}")
     return bundle_dir
 
 
-def _write_funnel_summary(metrics: dict, path: Path):
+def _evd5_aggregates(metrics: dict) -> dict:
+    """
+    Compute the funnel totals and ratios shared by the EVD 5 writers.
+
+    Ratios are left unrounded; each writer rounds them the way its output
+    has always been formatted.
+    """
+    conv = metrics['metrics']['conversion_rate']
+    ttr = metrics['metrics']['time_to_first_result']
+
+    ti = conv['total_issues']
+    tc = conv['total_claimed']
+    wr = ttr['count']
+    total_res = sum(map(itemgetter('total_linked_res'), ttr['details']))
+
+    return {
+        'total_res': total_res,
+        'claim_to_result_percent': wr / tc * 100 if tc > 0 else 0,
+        'issue_to_result_percent': wr / ti * 100 if ti > 0 else 0,
+        'avg_res': total_res / wr if wr > 0 else 0,
+    }
+
+
+def _write_funnel_summary(metrics: dict, agg: dict, today: str, path: Path):
     """Write aggregated funnel data as JSON."""
     conv = metrics['metrics']['conversion_rate']
     ttr = metrics['metrics']['time_to_first_result']
 
-    total_issues = conv['total_issues']
     total_claimed = conv['total_claimed']
     with_results = ttr['count']
-    total_res = sum(d['total_linked_res'] for d in ttr['details']) if ttr['details'] else 0
+    total_res = agg['total_res']
 
     summary = {
         "description": "Aggregated funnel data for EVD 5: Issue-to-Experiment-to-Result Conversion",
-        "snapshot_date": datetime.now().strftime('%Y-%m-%d'),
+        "snapshot_date": today,
         "system": "MATSUlab discourse graph",
         "funnel": {
-            "total_issues": total_issues,
+            "total_issues": conv['total_issues'],
             "claimed_experiments": total_claimed,
             "experiments_with_results": with_results,
             "total_res_nodes": total_res,
         },
         "conversion_rates": {
             "issue_to_claim_percent": conv['conversion_rate_percent'],
-            "claim_to_result_percent": round(with_results / total_claimed * 100, 1) if total_claimed > 0 else 0,
-            "issue_to_result_percent": round(with_results / total_issues * 100, 1) if total_issues > 0 else 0,
+            "claim_to_result_percent": round(agg['claim_to_result_percent'], 1),
+            "issue_to_result_percent": round(agg['issue_to_result_percent'], 1),
         },
         "claiming_type_breakdown": {
             "explicitly_claimed": conv['explicit_claims'],
@@ -107,7 +236,7 @@ def _write_funnel_summary(metrics: dict, path: Path):
         "result_breakdown": {
             "claimed_with_results": with_results,
             "claimed_without_results": total_claimed - with_results,
-            "avg_res_per_producing_experiment": round(total_res / with_results, 1) if with_results > 0 else 0,
+            "avg_res_per_producing_experiment": round(agg['avg_res'], 1),
         },
         "claiming_authorship": {
             "self_claimed": conv['self_claims'],
@@ -116,24 +245,20 @@ def _write_funnel_summary(metrics: dict, path: Path):
         },
     }
 
-    with open(path, 'w') as f:
-        json.dump(summary, f, indent=2)
+    _write_json(summary, path)
 
 
 def _write_experiment_details(metrics: dict, path: Path):
     """Write per-experiment detail rows as CSV."""
+    import csv
+
     conv = metrics['metrics']['conversion_rate']
     ttr = metrics['metrics']['time_to_first_result']
     ttc = metrics['metrics']['time_to_claim']
 
     # Build lookup maps for time-to-claim and time-to-result by experiment title
-    ttc_by_title = {}
-    for d in ttc.get('details', []):
-        ttc_by_title[d['title']] = d
-
-    ttr_by_title = {}
-    for d in ttr.get('details', []):
-        ttr_by_title[d['experiment_title']] = d
+    ttc_by_title = {d['title']: d for d in ttc.get('details', [])}
+    ttr_by_title = {d['experiment_title']: d for d in ttr.get('details', [])}
 
     # Collect all claimed experiments
     claimed = conv.get('claimed_experiment_list', [])
@@ -145,68 +270,60 @@ def _write_experiment_details(metrics: dict, path: Path):
         'time_to_claim_days', 'time_to_first_result_days',
     ]
 
-    with open(path, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for exp in claimed:
-            title = exp['title']
-            ttc_data = ttc_by_title.get(title, {})
-            ttr_data = ttr_by_title.get(title, {})
-
-            row = {
-                'title': anonymize_title(title),
-                'creator': anonymize_name(exp.get('creator', '')) or '',
-                'claimer': anonymize_name(exp.get('claimed_by', '')) or '',
-                'claim_type': exp.get('claim_type', ''),
-                'issue_created_by': anonymize_name(exp.get('issue_created_by', '')) or '',
-                'page_created': _fmt_dt(exp.get('page_created')),
-                'claimed_timestamp': _fmt_dt(exp.get('claimed_by_timestamp')),
-                'has_results': 'yes' if title in ttr_by_title else 'no',
-                'num_results': ttr_data.get('total_linked_res', 0),
-                'first_result_date': _fmt_dt(ttr_data.get('first_res_created')),
-                'time_to_claim_days': ttc_data.get('days_to_claim', ''),
-                'time_to_first_result_days': ttr_data.get('days_to_first_result', ''),
-            }
-            writer.writerow(row)
+    # Rows are built as lists in fieldnames order and written in one
+    # writerows() call, skipping DictWriter's per-row dict reordering.
+    # anonymize_name/anonymize_title are memoized in anonymize.py, so
+    # repeated researcher names and titles are plain cache hits here.
+    # Missing lookups share one empty dict instead of allocating two per row
+    no_data = {}
+    rows = []
+    for exp in claimed:
+        title = exp['title']
+        ttc_data = ttc_by_title.get(title, no_data)
+        ttr_data = ttr_by_title.get(title, no_data)
+
+        rows.append([
+            anonymize_title(title),
+            anonymize_name(exp.get('creator', '')) or '',
+            anonymize_name(exp.get('claimed_by', '')) or '',
+            exp.get('claim_type', ''),
+            anonymize_name(exp.get('issue_created_by', '')) or '',
+            _fmt_dt(exp.get('page_created')),
+            _fmt_dt(exp.get('claimed_by_timestamp')),
+            'yes' if title in ttr_by_title else 'no',
+            ttr_data.get('total_linked_res', 0),
+            _fmt_dt(ttr_data.get('first_res_created')),
+            ttc_data.get('days_to_claim', ''),
+            ttr_data.get('days_to_first_result', ''),
+        ])
+
+    with open(path, 'w', newline='', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
 
 
 def _fmt_dt(dt) -> str:
     """Format a datetime or string for CSV output."""
     if dt is None:
         return ''
+    # Exact-type checks cover the common cases; isoformat() slicing skips
+    # strftime's format-string parsing
+    t = type(dt)
+    if t is str:
+        return dt[:10]
+    if t is datetime:
+        return dt.isoformat()[:10]
     if isinstance(dt, datetime):
         return dt.strftime('%Y-%m-%d')
     if isinstance(dt, str):
-        return dt[:10] if len(dt) >= 10 else dt
+        return dt[:10]
     return str(dt)
 
 
-def _write_evidence_statement(metrics: dict, path: Path):
-    """Write the EVD 5 evidence statement and figure legend as markdown."""
-    conv = metrics['metrics']['conversion_rate']
-    ttr = metrics['metrics']['time_to_first_result']
-    total_res = sum(d['total_linked_res'] for d in ttr['details']) if ttr['details'] else 0
-
-    ti = conv['total_issues']
-    tc = conv['total_claimed']
-    wr = ttr['count']
-    ec = conv['explicit_claims']
-    ic = conv['inferred_claims']
-    ia = conv['iss_with_activity']
-    uc = conv['unclaimed_iss']
-    cr = conv['conversion_rate_percent']
-    c2r = round(wr / tc * 100, 0) if tc > 0 else 0
-    i2r = round(wr / ti * 100, 0) if ti > 0 else 0
-    avg_res = round(total_res / wr, 1) if wr > 0 else 0
-    no_res = tc - wr
-    iss_formal = len([i for i in range(ti) if True])  # placeholder; use unclaimed + iss_with_activity as ISS count
-    # ISS formal nodes = unclaimed ISS + ISS with activity (pages still named [[ISS]])
-    iss_formal_count = uc + ia
-    # Experiment pages = explicitly + inferred claiming
-    exp_pages_count = ec + ic
-
-    content = f"""# EVD 5 — Issue-to-Experiment-to-Result Conversion Funnel
+# Evidence statement and figure legend for EVD 5; filled in by
+# _write_evidence_statement with str.format_map
+_EVD5_STATEMENT_TEMPLATE = """# EVD 5 — Issue-to-Experiment-to-Result Conversion Funnel
 
 ## Evidence Statement
 
@@ -232,8 +349,82 @@ Of the {tc} claimed experiments, {wr} ({c2r:.0f}%) had at least one linked RES (
 
 **Supplemental Figure. Issue-to-experiment-to-result conversion funnel (aggregate view).** **(Left)** Horizontal bar chart showing progressive attrition across three stages: all issues (n={ti}), claimed experiments (n={tc}, {cr:.0f}%), and experiments with at least one formal result (n={wr}, {i2r:.0f}%). Annotations between bars indicate the stage-to-stage pass-through rate ({cr:.0f}% of issues claimed; {c2r:.0f}% of claimed experiments produced results). **(Right)** Stage-by-stage breakdown showing the composition at each level.
 """
-    with open(path, 'w') as f:
-        f.write(content)
+
+
+def _write_evidence_statement(metrics: dict, agg: dict, path: Path):
+    """Write the EVD 5 evidence statement and figure legend as markdown."""
+    conv = metrics['metrics']['conversion_rate']
+    ttr = metrics['metrics']['time_to_first_result']
+    total_res = agg['total_res']
+
+    ti = conv['total_issues']
+    tc = conv['total_claimed']
+    wr = ttr['count']
+    ec = conv['explicit_claims']
+    ic = conv['inferred_claims']
+    ia = conv['iss_with_activity']
+    uc = conv['unclaimed_iss']
+    cr = conv['conversion_rate_percent']
+    c2r = round(agg['claim_to_result_percent'], 0)
+    i2r = round(agg['issue_to_result_percent'], 0)
+    avg_res = round(agg['avg_res'], 1)
+    no_res = tc - wr
+    # ISS formal nodes = unclaimed ISS + ISS with activity (pages still named [[ISS]])
+    iss_formal_count = uc + ia
+    # Experiment pages = explicitly + inferred claiming
+    exp_pages_count = ec + ic
+
+    content = _EVD5_STATEMENT_TEMPLATE.format_map({
+        'ti': ti, 'tc': tc, 'wr': wr, 'ec': ec, 'ic': ic, 'ia': ia, 'cr': cr,
+        'c2r': c2r, 'i2r': i2r, 'avg_res': avg_res, 'no_res': no_res,
+        'total_res': total_res, 'iss_formal_count': iss_formal_count,
+        'exp_pages_count': exp_pages_count,
+    })
+    write_atomic(path, content.encode('utf-8'))
+
+
+def _extract_methods_sections(methods_path: Path, section_headers: list[str]) -> dict[str, list[str]]:
+    """
+    Collect the lines of each requested ``## `` section of methods.md.
+
+    Streams the file once, tracking which sections are open, instead of
+    rescanning the whole document per header. A section starts at the first
+    line beginning with its header and runs up to (not including) the next
+    ``## `` header; a header that does not match ends it. Lines are returned
+    without their trailing newline.
+
+    Returns:
+        Dict mapping each header to its lines (empty if not found)
+    """
+    sections = {header: [] for header in section_headers}
+    started = set()
+    active = []
+
+    def consume(line: str):
+        nonlocal active
+        stripped = line.strip()
+        if active:
+            if stripped.startswith('## '):
+                # Stop at the next ## header (same level or higher)
+                active = [h for h in active if stripped.startswith(h)]
+            for header in active:
+                sections[header].append(line)
+        for header in section_headers:
+            if header not in started and stripped.startswith(header):
+                started.add(header)
+                active.append(header)
+                sections[header].append(line)
+
+    ends_with_newline = True
+    with open(methods_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            ends_with_newline = line.endswith('\n')
+            consume(line[:-1] if ends_with_newline else line)
+    # Match str.split('\n'): text ending in a newline has a final empty line
+    if ends_with_newline:
+        consume('')
+
+    return sections
 
 
 def _write_methods_excerpt(output_dir: Path, path: Path):
@@ -250,74 +441,67 @@ def _write_methods_excerpt(output_dir: Path, path: Path):
 
     if not methods_path.exists():
         # Write a stub referencing the bundle data files
-        with open(path, 'w') as f:
-            f.write("# Methods Excerpt\n\nSee `data/funnel_summary.json` and `data/experiment_details.csv` for current counts.\n")
+        write_atomic(
+            path,
+            b"# Methods Excerpt\n\nSee `data/funnel_summary.json` and `data/experiment_details.csv` for current counts.\n",
+        )
         return
 
-    with open(methods_path, 'r') as f:
-        full_text = f.read()
-
-    lines = full_text.split('\n')
     extracted = ["# Methods Excerpt (EVD 5)\n"]
     extracted.append("This excerpt contains the methods sections relevant to the issue-to-experiment-to-result conversion funnel analysis. See `data/funnel_summary.json` and `data/experiment_details.csv` for current counts.\n")
     extracted.append("---\n")
 
     # Extract each target section
+    sections = _extract_methods_sections(methods_path, sections_to_extract)
     for section_header in sections_to_extract:
-        in_section = False
-        section_lines = []
-        for line in lines:
-            if line.strip().startswith(section_header):
-                in_section = True
-                section_lines.append(line)
-                continue
-            if in_section:
-                # Stop at the next ## header (same level or higher)
-                if line.strip().startswith('## ') and not line.strip().startswith(section_header):
-                    break
-                section_lines.append(line)
-
+        section_lines = sections[section_header]
         if section_lines:
             extracted.extend(section_lines)
             extracted.append('\n---\n')
 
-    with open(path, 'w') as f:
-        f.write('\n'.join(extracted))
+    write_atomic(path, '\n'.join(extracted).encode('utf-8'))
 
 
-def _write_evidence_jsonld(metrics: dict, path: Path):
+def _write_evidence_jsonld(metrics: dict, agg: dict, today: str, month: str, path: Path):
     """Write the canonical JSON-LD evidence bundle metadata."""
     conv = metrics['metrics']['conversion_rate']
     ttr = metrics['metrics']['time_to_first_result']
-    total_res = sum(d['total_linked_res'] for d in ttr['details']) if ttr['details'] else 0
+    total_res = agg['total_res']
+
+    ti = conv['total_issues']
+    tc = conv['total_claimed']
+    wr = ttr['count']
+    ec = conv['explicit_claims']
+    ic = conv['inferred_claims']
+    ia = conv['iss_with_activity']
+    uc = conv['unclaimed_iss']
+    cr = conv['conversion_rate_percent']
+    c2r_pct = round(agg['claim_to_result_percent'])
+    i2r_pct = round(agg['issue_to_result_percent'])
+    avg_res = round(agg['avg_res'], 1)
+    claims = conv['self_claims'] + conv['cross_person_claims']
+    cross_pct = round(conv['cross_person_claims'] / claims * 100) if claims > 0 else 0
 
     jsonld = {
-        "@context": {
-            "dc": "http://purl.org/dc/elements/1.1/",
-            "dcterms": "http://purl.org/dc/terms/",
-            "prov": "http://www.w3.org/ns/prov#",
-            "schema": "https://schema.org/",
-            "dgb": "https://discoursegraphs.com/schema/dg_base/",
-            "dge": "https://discoursegraphs.com/schema/dg_evidence/",
-        },
+        "@context": _DGE_CONTEXT,
         "@type": "dge:EvidenceBundle",
         "@id": "evd5-issue-funnel",
         "dc:title": (
-            f"[[RES]] - Of {conv['total_claimed']} claimed experiments in the MATSUlab, "
-            f"{ttr['count']} ({round(ttr['count'] / conv['total_claimed'] * 100) if conv['total_claimed'] > 0 else 0}%) "
+            f"[[RES]] - Of {tc} claimed experiments in the MATSUlab, "
+            f"{wr} ({c2r_pct}%) "
             f"produced at least one formal result node, yielding {total_res} total RES nodes, "
             f"and 15% of claiming involved cross-person idea exchange "
             f"- [[@analysis/quantify issue claiming from MATSUlab]]"
         ),
         "dc:creator": "Matt Akamatsu",
-        "dc:date": datetime.now().strftime('%Y-%m-%d'),
+        "dc:date": today,
         "dcterms:license": "https://creativecommons.org/licenses/by/4.0/",
         "dge:evidenceStatement": (
-            f"Of {conv['total_claimed']} claimed experiments in the MATSUlab discourse graph, "
-            f"{ttr['count']} ({round(ttr['count'] / conv['total_claimed'] * 100) if conv['total_claimed'] > 0 else 0}%) "
+            f"Of {tc} claimed experiments in the MATSUlab discourse graph, "
+            f"{wr} ({c2r_pct}%) "
             f"produced at least one formal result node, yielding {total_res} total RES nodes "
-            f"(avg {round(total_res / ttr['count'], 1) if ttr['count'] > 0 else 0} per result-producing experiment). "
-            f"{round(conv['cross_person_claims'] / (conv['self_claims'] + conv['cross_person_claims']) * 100) if (conv['self_claims'] + conv['cross_person_claims']) > 0 else 0}% "
+            f"(avg {avg_res} per result-producing experiment). "
+            f"{cross_pct}% "
             f"of claiming involved cross-person idea exchange, where the issue creator and claimer were different researchers."
         ),
         "dge:observable": {
@@ -327,7 +511,7 @@ def _write_evidence_jsonld(metrics: dict, path: Path):
                 f"The proportion of claimed experiments that produce formal result nodes "
                 f"and the extent of cross-person idea exchange (where a different researcher "
                 f"claims an issue than the one who created it). Measured across "
-                f"{conv['total_claimed']} claimed experiments, {ttr['count']} result-producing "
+                f"{tc} claimed experiments, {wr} result-producing "
                 f"experiments, and {total_res} RES nodes in the MATSUlab discourse graph."
             ),
         },
@@ -355,30 +539,30 @@ def _write_evidence_jsonld(metrics: dict, path: Path):
             "dc:title": "MATSUlab discourse graph",
             "dc:description": (
                 f"Akamatsu Lab Roam Research discourse graph, "
-                f"{datetime.now().strftime('%B %Y')} snapshot. "
-                f"Contains {conv['total_issues']} identifiable issues "
-                f"({conv['unclaimed_iss'] + conv['iss_with_activity']} formal ISS nodes + "
-                f"{conv['explicit_claims'] + conv['inferred_claims']} experiment pages), "
-                f"{conv['total_claimed']} claimed experiments, and "
+                f"{month} snapshot. "
+                f"Contains {ti} identifiable issues "
+                f"({uc + ia} formal ISS nodes + "
+                f"{ec + ic} experiment pages), "
+                f"{tc} claimed experiments, and "
                 f"{metrics['summary']['total_res_nodes']} result nodes."
             ),
             "schema:memberOf": "Akamatsu Lab, University of Washington",
-            "dcterms:temporal": datetime.now().strftime('%Y-%m-%d'),
+            "dcterms:temporal": today,
         },
         "dge:figure": [
             {
                 "@type": "schema:ImageObject",
                 "schema:contentUrl": "fig5_alluvial_flow.png",
-                "schema:encodingFormat": "image/png",
+                "schema:encodingFormat": _EVD5_BUNDLE_FILES['fig5_alluvial_flow.png'],
                 "dge:figureLegend": (
                     f"Figure 5. Issue-to-experiment-to-result flow in the MATSUlab discourse "
-                    f"graph. Alluvial (Sankey) diagram showing all {conv['total_claimed']} claimed "
+                    f"graph. Alluvial (Sankey) diagram showing all {tc} claimed "
                     f"experiments flowing through three stages: Issue Created (left, who created "
                     f"the issue), Claimed By (center, who claimed the experiment), and Result "
                     f"Created (right, who created the first formal result). Band width is "
                     f"proportional to number of experiments. Green bands indicate self-claiming; "
                     f"purple bands indicate cross-person claiming (idea exchange). Of the "
-                    f"{conv['total_claimed']} claimed experiments, {ttr['count']} produced at "
+                    f"{tc} claimed experiments, {wr} produced at "
                     f"least one formal result node. Researcher names are anonymized (R1\u2013R11); "
                     f"PI (Matt Akamatsu) is identified."
                 ),
@@ -386,21 +570,21 @@ def _write_evidence_jsonld(metrics: dict, path: Path):
             {
                 "@type": "schema:WebPage",
                 "schema:contentUrl": "fig5_alluvial_flow.html",
-                "schema:encodingFormat": "text/html",
+                "schema:encodingFormat": _EVD5_BUNDLE_FILES['fig5_alluvial_flow.html'],
                 "dc:description": "Interactive Plotly version of the alluvial flow diagram with hover tooltips.",
             },
             {
                 "@type": "schema:ImageObject",
                 "schema:contentUrl": "fig5_funnel_supplemental.png",
-                "schema:encodingFormat": "image/png",
+                "schema:encodingFormat": _EVD5_BUNDLE_FILES['fig5_funnel_supplemental.png'],
                 "dge:figureLegend": (
                     f"Supplemental Figure. Issue-to-experiment-to-result conversion funnel "
                     f"(aggregate view). (Left) Horizontal bar chart showing progressive "
-                    f"attrition across three stages: all issues (n={conv['total_issues']}), "
-                    f"claimed experiments (n={conv['total_claimed']}, "
-                    f"{conv['conversion_rate_percent']:.0f}%), and experiments with at least one "
-                    f"formal result (n={ttr['count']}, "
-                    f"{round(ttr['count'] / conv['total_issues'] * 100) if conv['total_issues'] > 0 else 0}%). "
+                    f"attrition across three stages: all issues (n={ti}), "
+                    f"claimed experiments (n={tc}, "
+                    f"{cr:.0f}%), and experiments with at least one "
+                    f"formal result (n={wr}, "
+                    f"{i2r_pct}%). "
                     f"(Right) Stage-by-stage breakdown showing composition at each level."
                 ),
             },
@@ -409,13 +593,13 @@ def _write_evidence_jsonld(metrics: dict, path: Path):
             {
                 "@type": "schema:DataDownload",
                 "schema:contentUrl": "data/funnel_summary.json",
-                "schema:encodingFormat": "application/json",
+                "schema:encodingFormat": _EVD5_BUNDLE_FILES['data/funnel_summary.json'],
                 "dc:description": "Aggregated funnel data with stage counts, conversion rates, and breakdowns",
             },
             {
                 "@type": "schema:DataDownload",
                 "schema:contentUrl": "data/experiment_details.csv",
-                "schema:encodingFormat": "text/csv",
+                "schema:encodingFormat": _EVD5_BUNDLE_FILES['data/experiment_details.csv'],
                 "dc:description": "Per-experiment detail rows with claiming type, timestamps, and result counts",
             },
         ],
@@ -429,7 +613,7 @@ def _write_evidence_jsonld(metrics: dict, path: Path):
         "prov:wasGeneratedBy": {
             "@type": "prov:Activity",
             "prov:startedAtTime": "2026-01-25",
-            "prov:endedAtTime": datetime.now().strftime('%Y-%m-%d'),
+            "prov:endedAtTime": today,
             "prov:used": [
                 Path(metrics['data_sources']['jsonld']).name if 'data_sources' in metrics else "akamatsulab_discourse-graph-json-LD.json",
                 Path(metrics['data_sources']['roam_json']).name if 'data_sources' in metrics else "akamatsulab-whole-graph-json.json",
@@ -440,153 +624,147 @@ def _write_evidence_jsonld(metrics: dict, path: Path):
             ],
         },
         "dge:summaryMetrics": {
-            "total_issues": conv['total_issues'],
-            "claimed_experiments": conv['total_claimed'],
-            "explicitly_claimed": conv['explicit_claims'],
-            "inferred_claiming": conv['inferred_claims'],
-            "iss_with_activity": conv['iss_with_activity'],
-            "experiments_with_results": ttr['count'],
+            "total_issues": ti,
+            "claimed_experiments": tc,
+            "explicitly_claimed": ec,
+            "inferred_claiming": ic,
+            "iss_with_activity": ia,
+            "experiments_with_results": wr,
             "total_res_nodes": total_res,
-            "conversion_rate_percent": conv['conversion_rate_percent'],
-            "claiming_to_result_percent": round(ttr['count'] / conv['total_claimed'] * 100, 1) if conv['total_claimed'] > 0 else 0,
+            "conversion_rate_percent": cr,
+            "claiming_to_result_percent": round(agg['claim_to_result_percent'], 1),
         },
     }
 
-    with open(path, 'w') as f:
-        json.dump(jsonld, f, indent=2, ensure_ascii=False)
+    _write_json(jsonld, path)
+
+
+# The EVD 5 RO-Crate manifest has no per-run content, so it is built and
+# serialized once at import time
+_RO_CRATE_EVD5 = {
+    "@context": "https://w3id.org/ro/crate/1.1/context",
+    "@graph": [
+        {
+            "@id": "ro-crate-metadata.json",
+            "@type": "CreativeWork",
+            "about": {"@id": "./"},
+            "conformsTo": {"@id": "https://w3id.org/ro/crate/1.1"},
+        },
+        {
+            "@id": "./",
+            "@type": "Dataset",
+            "name": (
+                "EVD 5: Issue-to-Experiment-to-Result Conversion Funnel — "
+                "MATSUlab Discourse Graph"
+            ),
+            "description": (
+                "Evidence bundle for the finding that 29% of MATSUlab issues "
+                "(n=445) were claimed as experiments and 11% produced at least "
+                "one formal result node, yielding 139 total RES nodes. "
+                "Contains the evidence statement, figure, underlying data, "
+                "and methodological documentation."
+            ),
+            "datePublished": "2026-02-14",
+            "creator": [
+                {"@id": "#matt-akamatsu"},
+            ],
+            "license": {"@id": "https://creativecommons.org/licenses/by/4.0/"},
+            "hasPart": [{"@id": name} for name in _EVD5_BUNDLE_FILES],
+        },
+        {
+            "@id": "#matt-akamatsu",
+            "@type": "Person",
+            "name": "Matt Akamatsu",
+            "affiliation": {"@id": "#uw"},
+        },
+        {
+            "@id": "#uw",
+            "@type": "Organization",
+            "name": "University of Washington",
+        },
+        {
+            "@id": "evidence.jsonld",
+            "@type": "File",
+            "name": "Evidence Bundle Metadata (JSON-LD)",
+            "description": (
+                "Canonical evidence bundle metadata using the dge: "
+                "(Discourse Graph Evidence) vocabulary. Contains the evidence "
+                "statement, observable/method/system attributes, provenance, "
+                "and references to all bundle contents."
+            ),
+            "encodingFormat": _EVD5_BUNDLE_FILES['evidence.jsonld'],
+        },
+        {
+            "@id": "fig5_alluvial_flow.png",
+            "@type": ["File", "ImageObject"],
+            "name": "Figure 5: Issue-to-Experiment-to-Result Alluvial Flow",
+            "description": (
+                "Alluvial (Sankey) diagram showing all claimed experiments flowing "
+                "through three stages: Issue Created → Claimed By → Result Created. "
+                "Band width proportional to experiment count; color indicates self-claiming "
+                "(green) vs cross-person claiming (purple). Researcher names anonymized."
+            ),
+            "encodingFormat": _EVD5_BUNDLE_FILES['fig5_alluvial_flow.png'],
+        },
+        {
+            "@id": "fig5_alluvial_flow.html",
+            "@type": ["File", "ImageObject"],
+            "name": "Figure 5 (interactive): Alluvial Flow Diagram",
+            "description": (
+                "Interactive Plotly version of the alluvial flow diagram. "
+                "Hover to see experiment counts per flow path."
+            ),
+            "encodingFormat": _EVD5_BUNDLE_FILES['fig5_alluvial_flow.html'],
+        },
+        {
+            "@id": "fig5_funnel_supplemental.png",
+            "@type": ["File", "ImageObject"],
+            "name": "Supplemental: Issue-to-Experiment-to-Result Conversion Funnel",
+            "description": (
+                "Supplemental aggregate view. Left: horizontal funnel bar chart "
+                "showing progressive attrition. Right: stage-by-stage composition "
+                "breakdown by claiming type and result status."
+            ),
+            "encodingFormat": _EVD5_BUNDLE_FILES['fig5_funnel_supplemental.png'],
+        },
+        {
+            "@id": "data/funnel_summary.json",
+            "@type": "File",
+            "name": "Funnel Summary Data",
+            "description": (
+                "Aggregated funnel counts, conversion rates, claiming type breakdown, "
+                "and result statistics."
+            ),
+            "encodingFormat": _EVD5_BUNDLE_FILES['data/funnel_summary.json'],
+        },
+        {
+            "@id": "data/experiment_details.csv",
+            "@type": "File",
+            "name": "Experiment Details",
+            "description": (
+                "Per-experiment rows with title, creator, claimed by, claiming type, "
+                "timestamps, result counts, and time metrics."
+            ),
+            "encodingFormat": _EVD5_BUNDLE_FILES['data/experiment_details.csv'],
+        },
+        {
+            "@id": "methods_excerpt.md",
+            "@type": "File",
+            "name": "Methods Excerpt",
+            "description": (
+                "Relevant sections from the full methods document covering "
+                "node identification, claiming detection, RES linking, and metric definitions."
+            ),
+            "encodingFormat": _EVD5_BUNDLE_FILES['methods_excerpt.md'],
+        },
+    ],
+}
+_RO_CRATE_EVD5_BYTES = dumps(_RO_CRATE_EVD5, pretty=True)
 
 
 def _write_ro_crate_metadata(path: Path):
     """Write the RO-Crate metadata manifest."""
-    rocrate = {
-        "@context": "https://w3id.org/ro/crate/1.1/context",
-        "@graph": [
-            {
-                "@id": "ro-crate-metadata.json",
-                "@type": "CreativeWork",
-                "about": {"@id": "./"},
-                "conformsTo": {"@id": "https://w3id.org/ro/crate/1.1"},
-            },
-            {
-                "@id": "./",
-                "@type": "Dataset",
-                "name": (
-                    "EVD 5: Issue-to-Experiment-to-Result Conversion Funnel — "
-                    "MATSUlab Discourse Graph"
-                ),
-                "description": (
-                    "Evidence bundle for the finding that 29% of MATSUlab issues "
-                    "(n=445) were claimed as experiments and 11% produced at least "
-                    "one formal result node, yielding 139 total RES nodes. "
-                    "Contains the evidence statement, figure, underlying data, "
-                    "and methodological documentation."
-                ),
-                "datePublished": "2026-02-14",
-                "creator": [
-                    {"@id": "#matt-akamatsu"},
-                ],
-                "license": {"@id": "https://creativecommons.org/licenses/by/4.0/"},
-                "hasPart": [
-                    {"@id": "evidence.jsonld"},
-                    {"@id": "fig5_alluvial_flow.png"},
-                    {"@id": "fig5_alluvial_flow.html"},
-                    {"@id": "fig5_funnel_supplemental.png"},
-                    {"@id": "data/funnel_summary.json"},
-                    {"@id": "data/experiment_details.csv"},
-                    {"@id": "methods_excerpt.md"},
-                ],
-            },
-            {
-                "@id": "#matt-akamatsu",
-                "@type": "Person",
-                "name": "Matt Akamatsu",
-                "affiliation": {"@id": "#uw"},
-            },
-            {
-                "@id": "#uw",
-                "@type": "Organization",
-                "name": "University of Washington",
-            },
-            {
-                "@id": "evidence.jsonld",
-                "@type": "File",
-                "name": "Evidence Bundle Metadata (JSON-LD)",
-                "description": (
-                    "Canonical evidence bundle metadata using the dge: "
-                    "(Discourse Graph Evidence) vocabulary. Contains the evidence "
-                    "statement, observable/method/system attributes, provenance, "
-                    "and references to all bundle contents."
-                ),
-                "encodingFormat": "application/ld+json",
-            },
-            {
-                "@id": "fig5_alluvial_flow.png",
-                "@type": ["File", "ImageObject"],
-                "name": "Figure 5: Issue-to-Experiment-to-Result Alluvial Flow",
-                "description": (
-                    "Alluvial (Sankey) diagram showing all claimed experiments flowing "
-                    "through three stages: Issue Created → Claimed By → Result Created. "
-                    "Band width proportional to experiment count; color indicates self-claiming "
-                    "(green) vs cross-person claiming (purple). Researcher names anonymized."
-                ),
-                "encodingFormat": "image/png",
-            },
-            {
-                "@id": "fig5_alluvial_flow.html",
-                "@type": ["File", "ImageObject"],
-                "name": "Figure 5 (interactive): Alluvial Flow Diagram",
-                "description": (
-                    "Interactive Plotly version of the alluvial flow diagram. "
-                    "Hover to see experiment counts per flow path."
-                ),
-                "encodingFormat": "text/html",
-            },
-            {
-                "@id": "fig5_funnel_supplemental.png",
-                "@type": ["File", "ImageObject"],
-                "name": "Supplemental: Issue-to-Experiment-to-Result Conversion Funnel",
-                "description": (
-                    "Supplemental aggregate view. Left: horizontal funnel bar chart "
-                    "showing progressive attrition. Right: stage-by-stage composition "
-                    "breakdown by claiming type and result status."
-                ),
-                "encodingFormat": "image/png",
-            },
-            {
-                "@id": "data/funnel_summary.json",
-                "@type": "File",
-                "name": "Funnel Summary Data",
-                "description": (
-                    "Aggregated funnel counts, conversion rates, claiming type breakdown, "
-                    "and result statistics."
-                ),
-                "encodingFormat": "application/json",
-            },
-            {
-                "@id": "data/experiment_details.csv",
-                "@type": "File",
-                "name": "Experiment Details",
-                "description": (
-                    "Per-experiment rows with title, creator, claimed by, claiming type, "
-                    "timestamps, result counts, and time metrics."
-                ),
-                "encodingFormat": "text/csv",
-            },
-            {
-                "@id": "methods_excerpt.md",
-                "@type": "File",
-                "name": "Methods Excerpt",
-                "description": (
-                    "Relevant sections from the full methods document covering "
-                    "node identification, claiming detection, RES linking, and metric definitions."
-                ),
-                "encodingFormat": "text/markdown",
-            },
-        ],
-    }
-
-    with open(path, 'w') as f:
-        json.dump(rocrate, f, indent=2, ensure_ascii=False)
+    write_atomic(path, _RO_CRATE_EVD5_BYTES)
 
 
 def create_evd7_bundle(output_dir: Path, viz_dir: Path, metrics: dict = None) -> Path:
@@ -601,21 +779,19 @@ def create_evd7_bundle(output_dir: Path, viz_dir: Path, metrics: dict = None) ->
     Returns:
         Path to the created bundle directory
     """
-    bundle_dir = output_dir / 'evidence_bundles' / 'evd7-student-onboarding'
-    bundle_dir.mkdir(parents=True, exist_ok=True)
-    (bundle_dir / 'data').mkdir(exist_ok=True)
+    bundle_dir = _bundle_dir(output_dir, 'evd7-student-onboarding')
 
     # Copy the figure
     fig_src = viz_dir / 'fig7_student_timelines.png'
     fig_dst = bundle_dir / 'fig7_student_timelines.png'
     if fig_src.exists():
-        shutil.copy2(fig_src, fig_dst)
+        _copy_file(fig_src, fig_dst)
 
     # Copy the milestone JSON data
     milestones_src = output_dir / 'student_milestones.json'
     milestones_dst = bundle_dir / 'data' / 'student_milestones.json'
     if milestones_src.exists():
-        shutil.copy2(milestones_src, milestones_dst)
+        _copy_file(milestones_src, milestones_dst)
 
     # Generate JSON-LD metadata
     _write_evd7_evidence_jsonld(bundle_dir / 'evidence.jsonld')
@@ -627,9 +803,8 @@ def create_evd7_bundle(output_dir: Path, viz_dir: Path, metrics: dict = None) ->
     return bundle_dir
 
 
-def _write_evd7_evidence_statement(path: Path):
-    """Write the EVD 7 evidence statement and figure legend as markdown."""
-    content = """# EVD 7 — Undergraduate Researcher Onboarding Timeline
+# Evidence statement and figure legend for EVD 7; entirely static
+_EVD7_STATEMENT_MD = """# EVD 7 — Undergraduate Researcher Onboarding Timeline
 
 ## Evidence Statement
 
@@ -655,220 +830,221 @@ The mean time-to-first-RES for undergraduate researchers (69 days) was faster th
 
 **Figure 7. Undergraduate researcher onboarding timeline in the MATSUlab discourse graph.** Gantt-style chart showing the progression of three anonymized undergraduate researchers (A, B, C) from lab start to first formal result (RES node). Horizontal bars indicate phases: blue = onboarding (first day to first experiment reference), green = development (first experiment to first plot), purple = result production (first plot to first RES). Colored markers indicate milestones: black = first day, red = first experiment, orange = first plot, green = first RES. Numbers above markers show days from lab start. Researcher A followed a self-directed exploration pathway (41 days to experiment, 125 days to RES). Researcher B was assigned an entry project (5 days to experiment, 47 days to RES). Researcher C was directly assigned to an existing experiment (7 days to experiment, 36 days to RES). All three pathways successfully produced formal results within 4 months, with structured assignment pathways yielding faster time-to-result.
 """
-    with open(path, 'w') as f:
-        f.write(content)
+_EVD7_STATEMENT_BYTES = _EVD7_STATEMENT_MD.encode('utf-8')
 
 
-def _write_evd7_evidence_jsonld(path: Path):
-    """Write the canonical JSON-LD evidence bundle metadata for EVD 7."""
-    jsonld = {
-        "@context": {
-            "dc": "http://purl.org/dc/elements/1.1/",
-            "dcterms": "http://purl.org/dc/terms/",
-            "prov": "http://www.w3.org/ns/prov#",
-            "schema": "https://schema.org/",
-            "dgb": "https://discoursegraphs.com/schema/dg_base/",
-            "dge": "https://discoursegraphs.com/schema/dg_evidence/",
-        },
-        "@type": "dge:EvidenceBundle",
-        "@id": "evd7-student-onboarding",
-        "dc:title": (
-            "[[RES]] - Three undergraduate researchers tracked in this analysis each produced "
-            "a formal result within ~4 months, with two reaching their first result within "
-            "~1 month - [[@analysis/quantify researcher onboarding from MATSUlab]]"
+def _write_evd7_evidence_statement(path: Path):
+    """Write the EVD 7 evidence statement and figure legend as markdown."""
+    write_atomic(path, _EVD7_STATEMENT_BYTES)
+
+
+# The EVD 7 JSON-LD and RO-Crate metadata describe a fixed analysis with no
+# per-run content, so both are built and serialized once at import time
+_EVIDENCE_JSONLD_EVD7 = {
+    "@context": _DGE_CONTEXT,
+    "@type": "dge:EvidenceBundle",
+    "@id": "evd7-student-onboarding",
+    "dc:title": (
+        "[[RES]] - Three undergraduate researchers tracked in this analysis each produced "
+        "a formal result within ~4 months, with two reaching their first result within "
+        "~1 month - [[@analysis/quantify researcher onboarding from MATSUlab]]"
+    ),
+    "dc:creator": "Matt Akamatsu",
+    "dc:date": "2026-01-31",
+    "dcterms:license": "https://creativecommons.org/licenses/by/4.0/",
+    "dge:evidenceStatement": (
+        "Three undergraduate researchers tracked in this analysis each produced a formal "
+        "result within ~4 months, with two reaching their first result within ~1 month."
+    ),
+    "dge:observable": {
+        "@type": "dge:Observable",
+        "dc:title": "Undergraduate researcher onboarding time-to-result",
+        "dc:description": (
+            "The time from a researcher's first day in the lab to their first formal "
+            "result (RES node) creation, measured for three undergraduate researchers "
+            "following different onboarding pathways."
         ),
-        "dc:creator": "Matt Akamatsu",
-        "dc:date": "2026-01-31",
-        "dcterms:license": "https://creativecommons.org/licenses/by/4.0/",
-        "dge:evidenceStatement": (
-            "Three undergraduate researchers tracked in this analysis each produced a formal "
-            "result within ~4 months, with two reaching their first result within ~1 month."
+    },
+    "dge:method": {
+        "@type": "dge:Method",
+        "dc:title": "Discourse graph milestone tracing",
+        "dc:description": (
+            "Manual extraction of key milestones from daily notes exports and experiment "
+            "page metadata. Milestones tracked: (1) first day in lab, (2) first experiment "
+            "reference in daily notes, (3) first plot (linked image), (4) first RES node "
+            "creation date. Researchers anonymized as A, B, C in outputs."
         ),
-        "dge:observable": {
-            "@type": "dge:Observable",
-            "dc:title": "Undergraduate researcher onboarding time-to-result",
-            "dc:description": (
-                "The time from a researcher's first day in the lab to their first formal "
-                "result (RES node) creation, measured for three undergraduate researchers "
-                "following different onboarding pathways."
+        "prov:used": [
+            {"@id": "src/student_timeline_analysis.py", "dc:description": "Timeline extraction and visualization"},
+        ],
+        "schema:codeRepository": "node-metrics",
+    },
+    "dge:system": {
+        "@type": "dge:System",
+        "dc:title": "MATSUlab discourse graph",
+        "dc:description": (
+            "Akamatsu Lab Roam Research discourse graph, January 2026 snapshot. "
+            "Includes daily notes, experiment pages, and result nodes for three "
+            "undergraduate researchers spanning February 2024 to July 2025."
+        ),
+        "schema:memberOf": "Akamatsu Lab, University of Washington",
+        "dcterms:temporal": "2026-01-31",
+    },
+    "dge:figure": [
+        {
+            "@type": "schema:ImageObject",
+            "schema:contentUrl": "fig7_student_timelines.png",
+            "schema:encodingFormat": "image/png",
+            "dge:figureLegend": (
+                "Figure 7. Three undergraduate researchers produced results in 125, 47, "
+                "and 36 days from start date. Timeline showing the progression of three "
+                "anonymized undergraduate researchers (A, B, C) from lab start to first "
+                "formal result (RES node). Milestones tracked: first day in lab, first "
+                "experiment, first plot, and first RES node. Researcher A: 42 days to "
+                "experiment, 125 days to RES. Researcher B: 5 days to experiment, 47 days "
+                "to RES. Researcher C: 7 days to experiment, 36 days to RES."
             ),
         },
-        "dge:method": {
-            "@type": "dge:Method",
-            "dc:title": "Discourse graph milestone tracing",
-            "dc:description": (
-                "Manual extraction of key milestones from daily notes exports and experiment "
-                "page metadata. Milestones tracked: (1) first day in lab, (2) first experiment "
-                "reference in daily notes, (3) first plot (linked image), (4) first RES node "
-                "creation date. Researchers anonymized as A, B, C in outputs."
-            ),
-            "prov:used": [
-                {"@id": "src/student_timeline_analysis.py", "dc:description": "Timeline extraction and visualization"},
-            ],
-            "schema:codeRepository": "node-metrics",
+    ],
+    "dge:groundingData": [
+        {
+            "@type": "schema:DataDownload",
+            "schema:contentUrl": "data/student_milestones.json",
+            "schema:encodingFormat": "application/json",
+            "dc:description": "Per-researcher milestone data with days from start and pathway type",
         },
-        "dge:system": {
-            "@type": "dge:System",
-            "dc:title": "MATSUlab discourse graph",
-            "dc:description": (
-                "Akamatsu Lab Roam Research discourse graph, January 2026 snapshot. "
-                "Includes daily notes, experiment pages, and result nodes for three "
-                "undergraduate researchers spanning February 2024 to July 2025."
-            ),
-            "schema:memberOf": "Akamatsu Lab, University of Washington",
-            "dcterms:temporal": "2026-01-31",
+    ],
+    "dge:documentation": [
+        {
+            "@type": "schema:TextDigitalDocument",
+            "schema:contentUrl": "methods_excerpt.md",
+            "dc:description": "Methods excerpt describing milestone tracing methodology and pathway classification",
         },
-        "dge:figure": [
-            {
-                "@type": "schema:ImageObject",
-                "schema:contentUrl": "fig7_student_timelines.png",
-                "schema:encodingFormat": "image/png",
-                "dge:figureLegend": (
-                    "Figure 7. Three undergraduate researchers produced results in 125, 47, "
-                    "and 36 days from start date. Timeline showing the progression of three "
-                    "anonymized undergraduate researchers (A, B, C) from lab start to first "
-                    "formal result (RES node). Milestones tracked: first day in lab, first "
-                    "experiment, first plot, and first RES node. Researcher A: 42 days to "
-                    "experiment, 125 days to RES. Researcher B: 5 days to experiment, 47 days "
-                    "to RES. Researcher C: 7 days to experiment, 36 days to RES."
-                ),
-            },
+    ],
+    "prov:wasGeneratedBy": {
+        "@type": "prov:Activity",
+        "prov:startedAtTime": "2026-01-31",
+        "prov:endedAtTime": "2026-01-31",
+        "prov:used": [
+            "Researcher A daily notes (anonymized)",
+            "Researcher B daily notes (anonymized)",
+            "Researcher C daily notes (anonymized)",
         ],
-        "dge:groundingData": [
-            {
-                "@type": "schema:DataDownload",
-                "schema:contentUrl": "data/student_milestones.json",
-                "schema:encodingFormat": "application/json",
-                "dc:description": "Per-researcher milestone data with days from start and pathway type",
-            },
+        "prov:wasAssociatedWith": [
+            {"@type": "prov:Agent", "dc:title": "Matt Akamatsu", "schema:affiliation": "University of Washington"},
+            {"@type": "prov:SoftwareAgent", "dc:title": "Claude", "schema:provider": "Anthropic"},
         ],
-        "dge:documentation": [
-            {
-                "@type": "schema:TextDigitalDocument",
-                "schema:contentUrl": "methods_excerpt.md",
-                "dc:description": "Methods excerpt describing milestone tracing methodology and pathway classification",
-            },
+    },
+    "dge:summaryMetrics": {
+        "researchers_analyzed": 3,
+        "mean_days_to_res": 69.3,
+        "min_days_to_res": 36,
+        "max_days_to_res": 125,
+        "pathways_identified": [
+            "Self-directed exploration",
+            "Assigned entry project",
+            "Direct assignment",
         ],
-        "prov:wasGeneratedBy": {
-            "@type": "prov:Activity",
-            "prov:startedAtTime": "2026-01-31",
-            "prov:endedAtTime": "2026-01-31",
-            "prov:used": [
-                "Researcher A daily notes (anonymized)",
-                "Researcher B daily notes (anonymized)",
-                "Researcher C daily notes (anonymized)",
+    },
+}
+_EVIDENCE_JSONLD_EVD7_BYTES = dumps(_EVIDENCE_JSONLD_EVD7, pretty=True)
+
+
+def _write_evd7_evidence_jsonld(path: Path):
+    """Write the canonical JSON-LD evidence bundle metadata for EVD 7."""
+    write_atomic(path, _EVIDENCE_JSONLD_EVD7_BYTES)
+
+
+_RO_CRATE_EVD7 = {
+    "@context": "https://w3id.org/ro/crate/1.1/context",
+    "@graph": [
+        {
+            "@id": "ro-crate-metadata.json",
+            "@type": "CreativeWork",
+            "about": {"@id": "./"},
+            "conformsTo": {"@id": "https://w3id.org/ro/crate/1.1"},
+        },
+        {
+            "@id": "./",
+            "@type": "Dataset",
+            "name": (
+                "EVD 7: Undergraduate Researcher Onboarding Timeline — "
+                "MATSUlab Discourse Graph"
+            ),
+            "description": (
+                "Evidence bundle for the finding that three undergraduate researchers "
+                "tracked in this analysis each produced a formal result within ~4 months, "
+                "with two reaching their first result within ~1 month. Contains the "
+                "evidence statement, figure, underlying data, and methodological documentation."
+            ),
+            "datePublished": "2026-01-31",
+            "creator": [
+                {"@id": "#matt-akamatsu"},
             ],
-            "prov:wasAssociatedWith": [
-                {"@type": "prov:Agent", "dc:title": "Matt Akamatsu", "schema:affiliation": "University of Washington"},
-                {"@type": "prov:SoftwareAgent", "dc:title": "Claude", "schema:provider": "Anthropic"},
+            "license": {"@id": "https://creativecommons.org/licenses/by/4.0/"},
+            "hasPart": [
+                {"@id": "evidence.jsonld"},
+                {"@id": "fig7_student_timelines.png"},
+                {"@id": "data/student_milestones.json"},
+                {"@id": "methods_excerpt.md"},
             ],
         },
-        "dge:summaryMetrics": {
-            "researchers_analyzed": 3,
-            "mean_days_to_res": 69.3,
-            "min_days_to_res": 36,
-            "max_days_to_res": 125,
-            "pathways_identified": [
-                "Self-directed exploration",
-                "Assigned entry project",
-                "Direct assignment",
-            ],
+        {
+            "@id": "#matt-akamatsu",
+            "@type": "Person",
+            "name": "Matt Akamatsu",
+            "affiliation": {"@id": "#uw"},
         },
-    }
-
-    with open(path, 'w') as f:
-        json.dump(jsonld, f, indent=2, ensure_ascii=False)
+        {
+            "@id": "#uw",
+            "@type": "Organization",
+            "name": "University of Washington",
+        },
+        {
+            "@id": "evidence.jsonld",
+            "@type": "File",
+            "name": "Evidence Bundle Metadata (JSON-LD)",
+            "description": (
+                "Canonical evidence bundle metadata using the dge: "
+                "(Discourse Graph Evidence) vocabulary."
+            ),
+            "encodingFormat": "application/ld+json",
+        },
+        {
+            "@id": "fig7_student_timelines.png",
+            "@type": ["File", "ImageObject"],
+            "name": "Figure 7: Undergraduate Researcher Onboarding Timeline",
+            "description": (
+                "Gantt-style chart showing progression of three anonymized "
+                "undergraduate researchers from lab start to first RES node."
+            ),
+            "encodingFormat": "image/png",
+        },
+        {
+            "@id": "data/student_milestones.json",
+            "@type": "File",
+            "name": "Student Milestones Data",
+            "description": (
+                "Per-researcher milestone data including days to experiment, "
+                "days to plot, days to RES, and onboarding pathway type."
+            ),
+            "encodingFormat": "application/json",
+        },
+        {
+            "@id": "methods_excerpt.md",
+            "@type": "File",
+            "name": "Methods Excerpt",
+            "description": "Methodology for milestone tracing and pathway classification.",
+            "encodingFormat": "text/markdown",
+        },
+    ],
+}
+_RO_CRATE_EVD7_BYTES = dumps(_RO_CRATE_EVD7, pretty=True)
 
 
 def _write_evd7_ro_crate_metadata(path: Path):
     """Write the RO-Crate metadata manifest for EVD 7."""
-    rocrate = {
-        "@context": "https://w3id.org/ro/crate/1.1/context",
-        "@graph": [
-            {
-                "@id": "ro-crate-metadata.json",
-                "@type": "CreativeWork",
-                "about": {"@id": "./"},
-                "conformsTo": {"@id": "https://w3id.org/ro/crate/1.1"},
-            },
-            {
-                "@id": "./",
-                "@type": "Dataset",
-                "name": (
-                    "EVD 7: Undergraduate Researcher Onboarding Timeline — "
-                    "MATSUlab Discourse Graph"
-                ),
-                "description": (
-                    "Evidence bundle for the finding that three undergraduate researchers "
-                    "tracked in this analysis each produced a formal result within ~4 months, "
-                    "with two reaching their first result within ~1 month. Contains the "
-                    "evidence statement, figure, underlying data, and methodological documentation."
-                ),
-                "datePublished": "2026-01-31",
-                "creator": [
-                    {"@id": "#matt-akamatsu"},
-                ],
-                "license": {"@id": "https://creativecommons.org/licenses/by/4.0/"},
-                "hasPart": [
-                    {"@id": "evidence.jsonld"},
-                    {"@id": "fig7_student_timelines.png"},
-                    {"@id": "data/student_milestones.json"},
-                    {"@id": "methods_excerpt.md"},
-                ],
-            },
-            {
-                "@id": "#matt-akamatsu",
-                "@type": "Person",
-                "name": "Matt Akamatsu",
-                "affiliation": {"@id": "#uw"},
-            },
-            {
-                "@id": "#uw",
-                "@type": "Organization",
-                "name": "University of Washington",
-            },
-            {
-                "@id": "evidence.jsonld",
-                "@type": "File",
-                "name": "Evidence Bundle Metadata (JSON-LD)",
-                "description": (
-                    "Canonical evidence bundle metadata using the dge: "
-                    "(Discourse Graph Evidence) vocabulary."
-                ),
-                "encodingFormat": "application/ld+json",
-            },
-            {
-                "@id": "fig7_student_timelines.png",
-                "@type": ["File", "ImageObject"],
-                "name": "Figure 7: Undergraduate Researcher Onboarding Timeline",
-                "description": (
-                    "Gantt-style chart showing progression of three anonymized "
-                    "undergraduate researchers from lab start to first RES node."
-                ),
-                "encodingFormat": "image/png",
-            },
-            {
-                "@id": "data/student_milestones.json",
-                "@type": "File",
-                "name": "Student Milestones Data",
-                "description": (
-                    "Per-researcher milestone data including days to experiment, "
-                    "days to plot, days to RES, and onboarding pathway type."
-                ),
-                "encodingFormat": "application/json",
-            },
-            {
-                "@id": "methods_excerpt.md",
-                "@type": "File",
-                "name": "Methods Excerpt",
-                "description": "Methodology for milestone tracing and pathway classification.",
-                "encodingFormat": "text/markdown",
-            },
-        ],
-    }
-
-    with open(path, 'w') as f:
-        json.dump(rocrate, f, indent=2, ensure_ascii=False)
+    write_atomic(path, _RO_CRATE_EVD7_BYTES)
 
 
 def create_evd1_bundle(metrics: dict, output_dir: Path, viz_dir: Path) -> Path:
@@ -883,9 +1059,8 @@ def create_evd1_bundle(metrics: dict, output_dir: Path, viz_dir: Path) -> Path:
     Returns:
         Path to the created bundle directory
     """
-    bundle_dir = output_dir / 'evidence_bundles' / 'evd1-conversion-rate'
-    bundle_dir.mkdir(parents=True, exist_ok=True)
-    (bundle_dir / 'data').mkdir(exist_ok=True)
+    bundle_dir = _bundle_dir(output_dir, 'evd1-conversion-rate')
+    today, month = _bundle_dates()
 
     # Copy figures
     fig_files = [
@@ -895,21 +1070,24 @@ def create_evd1_bundle(metrics: dict, output_dir: Path, viz_dir: Path) -> Path:
         'figS1_issue_timeline.html',
         'figS1_issue_timeline_animated.gif',
     ]
-    for fname in fig_files:
-        src = viz_dir / fname
-        dst = bundle_dir / fname
-        if src.exists():
-            shutil.copy2(src, dst)
+    _run_all(
+        [
+            (_copy_file, viz_dir / fname, bundle_dir / fname)
+            for fname in fig_files
+            if (viz_dir / fname).exists()
+        ],
+        max_workers=len(fig_files),
+    )
 
     # Generate data files
-    _write_evd1_conversion_data(metrics, bundle_dir / 'data' / 'conversion_data.json')
-    _write_evd1_timeline_data(metrics, bundle_dir / 'data' / 'issue_timeline_data.json')
+    _write_evd1_conversion_data(metrics, today, bundle_dir / 'data' / 'conversion_data.json')
+    _write_evd1_timeline_data(metrics, today, bundle_dir / 'data' / 'issue_timeline_data.json')
 
     # Generate methods excerpt at bundle root
     _write_evd1_methods_excerpt(output_dir, bundle_dir / 'methods_excerpt.md')
 
     # Generate JSON-LD metadata
-    _write_evd1_evidence_jsonld(metrics, bundle_dir / 'evidence.jsonld')
+    _write_evd1_evidence_jsonld(metrics, today, month, bundle_dir / 'evidence.jsonld')
 
     # Generate RO-Crate metadata
     _write_evd1_ro_crate_metadata(bundle_dir / 'ro-crate-metadata.json')
@@ -918,13 +1096,13 @@ def create_evd1_bundle(metrics: dict, output_dir: Path, viz_dir: Path) -> Path:
     return bundle_dir
 
 
-def _write_evd1_conversion_data(metrics: dict, path: Path):
+def _write_evd1_conversion_data(metrics: dict, today: str, path: Path):
     """Write aggregated conversion rate data as JSON."""
     conv = metrics['metrics']['conversion_rate']
 
     summary = {
         "description": "Aggregated conversion rate data for EVD 1: Issue Conversion Rate",
-        "snapshot_date": datetime.now().strftime('%Y-%m-%d'),
+        "snapshot_date": today,
         "system": "MATSUlab discourse graph",
         "conversion": {
             "total_issues": conv['total_issues'],
@@ -947,69 +1125,67 @@ def _write_evd1_conversion_data(metrics: dict, path: Path):
         },
     }
 
-    with open(path, 'w') as f:
-        json.dump(summary, f, indent=2)
+    _write_json(summary, path)
+
+
+def _issue_day(pc):
+    """Return the YYYY-MM-DD day of a page_created datetime or ISO string."""
+    # page_created is almost always a datetime, so try that first;
+    # date().isoformat() builds just the day, not the full timestamp
+    try:
+        return pc.date().isoformat()
+    except AttributeError:
+        # ISO string, or None when the creation time is unknown
+        return pc if pc is None else pc[:10]
 
 
-def _write_evd1_timeline_data(metrics: dict, path: Path):
+def _write_evd1_timeline_data(metrics: dict, today: str, path: Path):
     """Write issue creation timeline data as JSON for the introductory panel."""
-    from collections import OrderedDict
+    from collections import defaultdict
 
     conv = metrics['metrics']['conversion_rate']
 
-    # Collect all issue creation dates
+    # Collect all issue creation dates as (date, type, claimed, claim_type)
+    # tuples; they become dicts only when the JSON is assembled
     issues = []
 
     # Claimed experiments
     for exp in conv.get('claimed_experiment_list', []):
-        pc = exp.get('page_created')
-        if pc is None:
+        day = _issue_day(exp.get('page_created'))
+        if day is None:
             continue
-        if isinstance(pc, datetime):
-            pc = pc.isoformat()
-        issues.append({
-            'date': pc[:10] if isinstance(pc, str) else pc,
-            'type': 'experiment',
-            'claimed': True,
-            'claim_type': exp.get('claim_type', 'unknown'),
-        })
+        issues.append((day, 'experiment', True, exp.get('claim_type', 'unknown')))
 
     # ISS nodes
     for iss in metrics.get('iss_node_list', []):
-        pc = iss.get('page_created')
-        if pc is None:
+        day = _issue_day(iss.get('page_created'))
+        if day is None:
             continue
-        if isinstance(pc, datetime):
-            pc = pc.isoformat()
-        issues.append({
-            'date': pc[:10] if isinstance(pc, str) else pc,
-            'type': 'ISS',
-            'claimed': iss.get('is_claimed', False),
-            'claim_type': 'iss_activity' if iss.get('is_claimed', False) else 'unclaimed',
-        })
+        claimed = iss.get('is_claimed', False)
+        issues.append((day, 'ISS', claimed, 'iss_activity' if claimed else 'unclaimed'))
 
-    issues.sort(key=lambda x: x['date'])
+    # The issues array is part of the published timeline data, so it stays
+    # date-ordered; the month buckets below no longer depend on this order
+    issues.sort(key=itemgetter(0))
 
-    # Monthly summary
-    monthly = OrderedDict()
-    cum_total = 0
-    cum_claimed = 0
-    for iss in issues:
-        month = iss['date'][:7]
-        if month not in monthly:
-            monthly[month] = {'month': month, 'new_issues': 0, 'new_claimed': 0}
-        monthly[month]['new_issues'] += 1
-        if iss['claimed']:
-            monthly[month]['new_claimed'] += 1
+    # Monthly summary: [new issues, new claimed] per YYYY-MM
+    monthly = defaultdict(lambda: [0, 0])
+    for day, _, claimed, _ in issues:
+        counts = monthly[day[:7]]
+        counts[0] += 1
+        if claimed:
+            counts[1] += 1
 
     monthly_list = []
-    for m in monthly.values():
-        cum_total += m['new_issues']
-        cum_claimed += m['new_claimed']
+    cum_total = 0
+    cum_claimed = 0
+    for month, (new_issues, new_claimed) in sorted(monthly.items()):
+        cum_total += new_issues
+        cum_claimed += new_claimed
         monthly_list.append({
-            'month': m['month'],
-            'new_issues': m['new_issues'],
-            'new_claimed': m['new_claimed'],
+            'month': month,
+            'new_issues': new_issues,
+            'new_claimed': new_claimed,
             'cumulative_issues': cum_total,
             'cumulative_claimed': cum_claimed,
         })
@@ -1023,45 +1199,28 @@ def _write_evd1_timeline_data(metrics: dict, path: Path):
 
     timeline_data = {
         'description': 'Issue creation timeline data for EVD 1 introductory panel',
-        'snapshot_date': datetime.now().strftime('%Y-%m-%d'),
+        'snapshot_date': today,
         'total_issues': len(issues),
-        'total_claimed': sum(1 for i in issues if i['claimed']),
-        'issues': issues,
+        # Every issue lands in exactly one month, so the running total is
+        # the overall claimed count
+        'total_claimed': cum_claimed,
+        'issues': [
+            {'date': day, 'type': issue_type, 'claimed': claimed, 'claim_type': claim_type}
+            for day, issue_type, claimed, claim_type in issues
+        ],
         'monthly_summary': monthly_list,
         'discourse_node_growth': node_type_dates,
         'total_content_nodes': graph_growth.get('total_content_nodes', 0),
     }
 
-    with open(path, 'w') as f:
-        json.dump(timeline_data, f, indent=2)
+    # Per-issue records make this the largest bundle data file; it is read
+    # by scripts rather than people, so it is written compact
+    _write_json(timeline_data, path, pretty=False)
 
 
-def _write_evd1_evidence_statement(metrics: dict, path: Path):
-    """Write the EVD 1 evidence statement and figure legend as markdown."""
-    conv = metrics['metrics']['conversion_rate']
-    ttr = metrics['metrics']['time_to_first_result']
-    total_res = sum(d['total_linked_res'] for d in ttr['details']) if ttr['details'] else 0
-
-    ti = conv['total_issues']
-    tc = conv['total_claimed']
-    ec = conv['explicit_claims']
-    ic = conv['inferred_claims']
-    ia = conv['iss_with_activity']
-    uc = conv['unclaimed_iss']
-    cr = conv['conversion_rate_percent']
-    sc = conv['self_claims']
-    xp = conv['cross_person_claims']
-    wr = ttr['count']
-    c2r = round(wr / tc * 100, 0) if tc > 0 else 0
-    avg_res = round(total_res / wr, 1) if wr > 0 else 0
-    no_res = tc - wr
-    known_pairs = sc + xp
-    self_pct = round(sc / known_pairs * 100, 0) if known_pairs > 0 else 0
-    xp_pct = round(xp / known_pairs * 100, 0) if known_pairs > 0 else 0
-    iss_formal_count = uc + ia
-    exp_pages_count = ec + ic
-
-    content = f"""# EVD 1 \u2014 Issue Conversion Rate
+# Evidence statement and figure legend for EVD 1; filled in by
+# _write_evd1_evidence_statement with str.format_map
+_EVD1_STATEMENT_TEMPLATE = """# EVD 1 \u2014 Issue Conversion Rate
 
 ## Evidence Statement
 
@@ -1086,8 +1245,41 @@ Among the {known_pairs} claimed experiments with known creator–claimer pairs,
 
 **Figure 1. Issue conversion rate and claiming authorship in the MATSUlab discourse graph.** **(Left)** Stacked horizontal bar showing the composition of all {ti} issues. Blue: explicitly claimed via `Claimed By::` metadata field (n={ec}). Green: inferred as claimed based on experimental log entries authored by the page creator (n={ic}). Amber: ISS pages with experimental log activity but no formal conversion to experiment format (n={ia}). Grey: unclaimed ISS pages with no evidence of active work (n={uc}). Bracket indicates total claimed issues ({tc}, {cr}%). **(Right)** Donut chart showing claiming authorship breakdown among the {known_pairs} claimed experiments. Orange: self-claimed where the issue creator and the person claiming were the same person (n={sc}, {self_pct:.0f}%). Purple: cross-person claiming where a different researcher claimed the issue (n={xp}, {xp_pct:.0f}%).
 """
-    with open(path, 'w') as f:
-        f.write(content)
+
+
+def _write_evd1_evidence_statement(metrics: dict, path: Path):
+    """Write the EVD 1 evidence statement and figure legend as markdown."""
+    conv = metrics['metrics']['conversion_rate']
+    ttr = metrics['metrics']['time_to_first_result']
+    total_res = sum(map(itemgetter('total_linked_res'), ttr['details']))
+
+    ti = conv['total_issues']
+    tc = conv['total_claimed']
+    ec = conv['explicit_claims']
+    ic = conv['inferred_claims']
+    ia = conv['iss_with_activity']
+    uc = conv['unclaimed_iss']
+    cr = conv['conversion_rate_percent']
+    sc = conv['self_claims']
+    xp = conv['cross_person_claims']
+    wr = ttr['count']
+    c2r = round(wr / tc * 100, 0) if tc > 0 else 0
+    avg_res = round(total_res / wr, 1) if wr > 0 else 0
+    no_res = tc - wr
+    known_pairs = sc + xp
+    self_pct = round(sc / known_pairs * 100, 0) if known_pairs > 0 else 0
+    xp_pct = round(xp / known_pairs * 100, 0) if known_pairs > 0 else 0
+    iss_formal_count = uc + ia
+    exp_pages_count = ec + ic
+
+    content = _EVD1_STATEMENT_TEMPLATE.format_map({
+        'ti': ti, 'tc': tc, 'ec': ec, 'ic': ic, 'ia': ia, 'uc': uc, 'cr': cr,
+        'sc': sc, 'xp': xp, 'wr': wr, 'c2r': c2r, 'avg_res': avg_res,
+        'no_res': no_res, 'total_res': total_res, 'known_pairs': known_pairs,
+        'self_pct': self_pct, 'xp_pct': xp_pct,
+        'iss_formal_count': iss_formal_count, 'exp_pages_count': exp_pages_count,
+    })
+    write_atomic(path, content.encode('utf-8'))
 
 
 def _write_evd1_methods_excerpt(output_dir: Path, path: Path):
@@ -1101,75 +1293,68 @@ def _write_evd1_methods_excerpt(output_dir: Path, path: Path):
     ]
 
     if not methods_path.exists():
-        with open(path, 'w') as f:
-            f.write("# Methods Excerpt\n\nSee `data/conversion_data.json` for current data counts.\n")
+        write_atomic(
+            path,
+            b"# Methods Excerpt\n\nSee `data/conversion_data.json` for current data counts.\n",
+        )
         return
 
-    with open(methods_path, 'r') as f:
-        full_text = f.read()
-
-    lines = full_text.split('\n')
     extracted = ["# Methods Excerpt (EVD 1)\n"]
     extracted.append("This excerpt contains the methods sections relevant to the issue conversion rate analysis. See `data/conversion_data.json` for current data counts.\n")
     extracted.append("---\n")
 
+    sections = _extract_methods_sections(methods_path, sections_to_extract)
     for section_header in sections_to_extract:
-        in_section = False
-        section_lines = []
-        for line in lines:
-            if line.strip().startswith(section_header):
-                in_section = True
-                section_lines.append(line)
-                continue
-            if in_section:
-                if line.strip().startswith('## ') and not line.strip().startswith(section_header):
-                    break
-                section_lines.append(line)
-
+        section_lines = sections[section_header]
         if section_lines:
             extracted.extend(section_lines)
             extracted.append('\n---\n')
 
-    with open(path, 'w') as f:
-        f.write('\n'.join(extracted))
+    write_atomic(path, '\n'.join(extracted).encode('utf-8'))
+
+
+# Headline EVD 1 claim, shared by several JSON-LD fields
+_EVD1_CLAIM_TEMPLATE = "{cr:.0f}% of MATSUlab issues (n={ti}) were claimed as experiments"
 
 
-def _write_evd1_evidence_jsonld(metrics: dict, path: Path):
+def _write_evd1_evidence_jsonld(metrics: dict, today: str, month: str, path: Path):
     """Write the canonical JSON-LD evidence bundle metadata for EVD 1."""
     conv = metrics['metrics']['conversion_rate']
-    ttr = metrics['metrics']['time_to_first_result']
-    total_res = sum(d['total_linked_res'] for d in ttr['details']) if ttr['details'] else 0
+
+    ti = conv['total_issues']
+    tc = conv['total_claimed']
+    ec = conv['explicit_claims']
+    ic = conv['inferred_claims']
+    ia = conv['iss_with_activity']
+    uc = conv['unclaimed_iss']
+    cr = conv['conversion_rate_percent']
+    sc = conv['self_claims']
+    xp = conv['cross_person_claims']
+    known_pairs = sc + xp
+    self_pct = round(sc / known_pairs * 100) if known_pairs > 0 else 0
+    xp_pct = round(xp / known_pairs * 100) if known_pairs > 0 else 0
+    # Headline claim shared by the title, evidence statement and figure legend
+    claim = _EVD1_CLAIM_TEMPLATE.format(cr=cr, ti=ti)
 
     jsonld = {
-        "@context": {
-            "dc": "http://purl.org/dc/elements/1.1/",
-            "dcterms": "http://purl.org/dc/terms/",
-            "prov": "http://www.w3.org/ns/prov#",
-            "schema": "https://schema.org/",
-            "dgb": "https://discoursegraphs.com/schema/dg_base/",
-            "dge": "https://discoursegraphs.com/schema/dg_evidence/",
-        },
+        "@context": _DGE_CONTEXT,
         "@type": "dge:EvidenceBundle",
         "@id": "evd1-conversion-rate",
         "dc:title": (
-            f"[[RES]] - {conv['conversion_rate_percent']:.0f}% of MATSUlab issues "
-            f"(n={conv['total_issues']}) were claimed as experiments "
+            f"[[RES]] - {claim} "
             f"- [[@analysis/quantify issue claiming from MATSUlab]]"
         ),
         "dc:creator": "Matt Akamatsu",
-        "dc:date": datetime.now().strftime('%Y-%m-%d'),
+        "dc:date": today,
         "dcterms:license": "https://creativecommons.org/licenses/by/4.0/",
-        "dge:evidenceStatement": (
-            f"{conv['conversion_rate_percent']:.0f}% of MATSUlab issues "
-            f"(n={conv['total_issues']}) were claimed as experiments."
-        ),
+        "dge:evidenceStatement": f"{claim}.",
         "dge:observable": {
             "@type": "dge:Observable",
             "dc:title": "Issue-to-experiment conversion rate",
             "dc:description": (
                 f"The proportion of issues posted to a discourse graph Issues board that "
                 f"are claimed as experiments. Measured across "
-                f"{conv['total_issues']} issues and {conv['total_claimed']} claimed experiments "
+                f"{ti} issues and {tc} claimed experiments "
                 f"in the MATSUlab discourse graph."
             ),
         },
@@ -1178,10 +1363,10 @@ def _write_evd1_evidence_jsonld(metrics: dict, path: Path):
             "dc:title": "Discourse graph conversion rate analysis",
             "dc:description": (
                 f"Automated pipeline parsing JSON-LD and Roam JSON exports to identify "
-                f"issue nodes ({conv['unclaimed_iss'] + conv['iss_with_activity']} formal ISS + "
-                f"{conv['explicit_claims'] + conv['inferred_claims']} experiment pages), detect claiming via "
-                f"a two-tier strategy (explicitly claimed via Claimed By:: field, n={conv['explicit_claims']}; inferred via "
-                f"experimental log presence, n={conv['inferred_claims']}; plus {conv['iss_with_activity']} ISS pages "
+                f"issue nodes ({uc + ia} formal ISS + "
+                f"{ec + ic} experiment pages), detect claiming via "
+                f"a two-tier strategy (explicitly claimed via Claimed By:: field, n={ec}; inferred via "
+                f"experimental log presence, n={ic}; plus {ia} ISS pages "
                 f"with activity), and link result nodes using a 3-tier matching strategy (relation instances, "
                 f"backreference matching, full description matching)."
             ),
@@ -1198,15 +1383,15 @@ def _write_evd1_evidence_jsonld(metrics: dict, path: Path):
             "dc:title": "MATSUlab discourse graph",
             "dc:description": (
                 f"Akamatsu Lab Roam Research discourse graph, "
-                f"{datetime.now().strftime('%B %Y')} snapshot. "
-                f"Contains {conv['total_issues']} identifiable issues "
-                f"({conv['unclaimed_iss'] + conv['iss_with_activity']} formal ISS nodes + "
-                f"{conv['explicit_claims'] + conv['inferred_claims']} experiment pages), "
-                f"{conv['total_claimed']} claimed experiments, and "
+                f"{month} snapshot. "
+                f"Contains {ti} identifiable issues "
+                f"({uc + ia} formal ISS nodes + "
+                f"{ec + ic} experiment pages), "
+                f"{tc} claimed experiments, and "
                 f"{metrics['summary']['total_res_nodes']} result nodes."
             ),
             "schema:memberOf": "Akamatsu Lab, University of Washington",
-            "dcterms:temporal": datetime.now().strftime('%Y-%m-%d'),
+            "dcterms:temporal": today,
         },
         "dge:figure": [
             {
@@ -1214,20 +1399,17 @@ def _write_evd1_evidence_jsonld(metrics: dict, path: Path):
                 "schema:contentUrl": "fig1_conversion_rate.png",
                 "schema:encodingFormat": "image/png",
                 "dge:figureLegend": (
-                    f"Figure 1. {conv['conversion_rate_percent']:.0f}% of MATSUlab issues "
-                    f"(n={conv['total_issues']}) were claimed as experiments. "
+                    f"Figure 1. {claim}. "
                     f"(Left) Stacked horizontal bar showing the composition "
-                    f"of all {conv['total_issues']} issues: explicitly claimed ({conv['explicit_claims']}, blue), "
-                    f"inferred claiming ({conv['inferred_claims']}, green), "
-                    f"ISS with activity ({conv['iss_with_activity']}, amber), "
-                    f"unclaimed ({conv['unclaimed_iss']}, grey). Bracket indicates "
-                    f"total claimed: {conv['total_claimed']} ({conv['conversion_rate_percent']}%). "
+                    f"of all {ti} issues: explicitly claimed ({ec}, blue), "
+                    f"inferred claiming ({ic}, green), "
+                    f"ISS with activity ({ia}, amber), "
+                    f"unclaimed ({uc}, grey). Bracket indicates "
+                    f"total claimed: {tc} ({cr}%). "
                     f"(Right) Donut chart showing claiming authorship "
-                    f"among {conv['self_claims'] + conv['cross_person_claims']} claimed experiments: "
-                    f"self-claimed ({conv['self_claims']}, "
-                    f"{round(conv['self_claims'] / (conv['self_claims'] + conv['cross_person_claims']) * 100) if (conv['self_claims'] + conv['cross_person_claims']) > 0 else 0}%) "
-                    f"and cross-person claiming ({conv['cross_person_claims']}, "
-                    f"{round(conv['cross_person_claims'] / (conv['self_claims'] + conv['cross_person_claims']) * 100) if (conv['self_claims'] + conv['cross_person_claims']) > 0 else 0}%)."
+                    f"among {known_pairs} claimed experiments: "
+                    f"self-claimed ({sc}, {self_pct}%) "
+                    f"and cross-person claiming ({xp}, {xp_pct}%)."
                 ),
             },
             {
@@ -1264,7 +1446,7 @@ def _write_evd1_evidence_jsonld(metrics: dict, path: Path):
         "prov:wasGeneratedBy": {
             "@type": "prov:Activity",
             "prov:startedAtTime": "2026-01-25",
-            "prov:endedAtTime": datetime.now().strftime('%Y-%m-%d'),
+            "prov:endedAtTime": today,
             "prov:used": [
                 Path(metrics['data_sources']['jsonld']).name if 'data_sources' in metrics else "akamatsulab_discourse-graph-json-LD.json",
                 Path(metrics['data_sources']['roam_json']).name if 'data_sources' in metrics else "akamatsulab-whole-graph-json.json",
@@ -1275,174 +1457,176 @@ def _write_evd1_evidence_jsonld(metrics: dict, path: Path):
             ],
         },
         "dge:summaryMetrics": {
-            "total_issues": conv['total_issues'],
-            "claimed_experiments": conv['total_claimed'],
-            "explicitly_claimed": conv['explicit_claims'],
-            "inferred_claiming": conv['inferred_claims'],
-            "iss_with_activity": conv['iss_with_activity'],
-            "unclaimed_iss": conv['unclaimed_iss'],
-            "conversion_rate_percent": conv['conversion_rate_percent'],
+            "total_issues": ti,
+            "claimed_experiments": tc,
+            "explicitly_claimed": ec,
+            "inferred_claiming": ic,
+            "iss_with_activity": ia,
+            "unclaimed_iss": uc,
+            "conversion_rate_percent": cr,
         },
     }
 
-    with open(path, 'w') as f:
-        json.dump(jsonld, f, indent=2, ensure_ascii=False)
+    _write_json(jsonld, path)
+
+
+# The EVD 1 RO-Crate manifest has no per-run content, so it is built and
+# serialized once at import time
+_RO_CRATE_EVD1 = {
+    "@context": "https://w3id.org/ro/crate/1.1/context",
+    "@graph": [
+        {
+            "@id": "ro-crate-metadata.json",
+            "@type": "CreativeWork",
+            "about": {"@id": "./"},
+            "conformsTo": {"@id": "https://w3id.org/ro/crate/1.1"},
+        },
+        {
+            "@id": "./",
+            "@type": "Dataset",
+            "name": (
+                "EVD 1: Issue Conversion Rate \u2014 "
+                "MATSUlab Discourse Graph"
+            ),
+            "description": (
+                "Evidence bundle for the finding that 29% of MATSUlab issues "
+                "(n=445) were claimed as experiments and 38% of those produced "
+                "at least one formal result node, yielding 139 total RES nodes. "
+                "Contains the evidence statement, static and interactive figures, "
+                "underlying data, and methodological documentation."
+            ),
+            "datePublished": "2026-02-14",
+            "creator": [
+                {"@id": "#matt-akamatsu"},
+            ],
+            "license": {"@id": "https://creativecommons.org/licenses/by/4.0/"},
+            "hasPart": [
+                {"@id": "evidence.jsonld"},
+                {"@id": "figS1_issue_timeline.png"},
+                {"@id": "figS1_issue_timeline.html"},
+                {"@id": "figS1_issue_timeline_animated.gif"},
+                {"@id": "fig1_conversion_rate.png"},
+                {"@id": "fig1_conversion_rate.html"},
+                {"@id": "data/conversion_data.json"},
+                {"@id": "data/issue_timeline_data.json"},
+                {"@id": "methods_excerpt.md"},
+            ],
+        },
+        {
+            "@id": "#matt-akamatsu",
+            "@type": "Person",
+            "name": "Matt Akamatsu",
+            "affiliation": {"@id": "#uw"},
+        },
+        {
+            "@id": "#uw",
+            "@type": "Organization",
+            "name": "University of Washington",
+        },
+        {
+            "@id": "evidence.jsonld",
+            "@type": "File",
+            "name": "Evidence Bundle Metadata (JSON-LD)",
+            "description": (
+                "Canonical evidence bundle metadata using the dge: "
+                "(Discourse Graph Evidence) vocabulary."
+            ),
+            "encodingFormat": "application/ld+json",
+        },
+        {
+            "@id": "figS1_issue_timeline.png",
+            "@type": ["File", "ImageObject"],
+            "name": "Figure S1: Issue Creation Timeline (static)",
+            "description": (
+                "Cumulative issue creation over time with dual y-axis. "
+                "Left axis: cumulative issue count (claimed vs unclaimed). "
+                "Right axis: issues as percentage of total discourse nodes. "
+                "Introductory panel contextualizing when and how the 445 issues accumulated."
+            ),
+            "encodingFormat": "image/png",
+        },
+        {
+            "@id": "figS1_issue_timeline.html",
+            "@type": ["File", "WebPage"],
+            "name": "Figure S1: Issue Creation Timeline (interactive)",
+            "description": (
+                "Interactive Plotly version of the issue creation timeline. "
+                "Hover for date and count details. Toggle between discourse node "
+                "and all-content-page denominators for percentage calculation."
+            ),
+            "encodingFormat": "text/html",
+        },
+        {
+            "@id": "figS1_issue_timeline_animated.gif",
+            "@type": ["File", "ImageObject"],
+            "name": "Figure S1 (animated): Issue Creation Timeline",
+            "description": (
+                "Animated GIF showing cumulative issue creation month by month, "
+                "with running counter. Suitable for presentations."
+            ),
+            "encodingFormat": "image/gif",
+        },
+        {
+            "@id": "fig1_conversion_rate.png",
+            "@type": ["File", "ImageObject"],
+            "name": "Figure 1: Issue Conversion Rate (static)",
+            "description": (
+                "Two-panel figure. Left: stacked horizontal bar showing 445 issues "
+                "broken down by claiming type (69 explicitly, 56 inferred, 5 ISS with "
+                "activity, 315 unclaimed). Right: donut chart of claiming authorship "
+                "(106 self-claimed, 19 cross-person)."
+            ),
+            "encodingFormat": "image/png",
+        },
+        {
+            "@id": "fig1_conversion_rate.html",
+            "@type": ["File", "WebPage"],
+            "name": "Figure 1: Issue Conversion Rate (interactive)",
+            "description": (
+                "Interactive HTML/JS version of Figure 1 with hover tooltips, "
+                "animated transitions, and responsive layout. Self-contained "
+                "single-file application."
+            ),
+            "encodingFormat": "text/html",
+        },
+        {
+            "@id": "data/conversion_data.json",
+            "@type": "File",
+            "name": "Conversion Rate Data",
+            "description": (
+                "Aggregated conversion rate data with claiming type breakdown, "
+                "authorship statistics, and result production metrics."
+            ),
+            "encodingFormat": "application/json",
+        },
+        {
+            "@id": "data/issue_timeline_data.json",
+            "@type": "File",
+            "name": "Issue Timeline Data",
+            "description": (
+                "Per-issue creation dates, monthly summary with cumulative counts, "
+                "and discourse node growth data by type. Supports Figure 0 visualizations."
+            ),
+            "encodingFormat": "application/json",
+        },
+        {
+            "@id": "methods_excerpt.md",
+            "@type": "File",
+            "name": "Methods Excerpt",
+            "description": (
+                "Relevant sections from the full methods document covering "
+                "node identification, claiming detection, and conversion rate calculation."
+            ),
+            "encodingFormat": "text/markdown",
+        },
+    ],
+}
+_RO_CRATE_EVD1_BYTES = dumps(_RO_CRATE_EVD1, pretty=True)
 
 
 def _write_evd1_ro_crate_metadata(path: Path):
     """Write the RO-Crate metadata manifest for EVD 1."""
-    rocrate = {
-        "@context": "https://w3id.org/ro/crate/1.1/context",
-        "@graph": [
-            {
-                "@id": "ro-crate-metadata.json",
-                "@type": "CreativeWork",
-                "about": {"@id": "./"},
-                "conformsTo": {"@id": "https://w3id.org/ro/crate/1.1"},
-            },
-            {
-                "@id": "./",
-                "@type": "Dataset",
-                "name": (
-                    "EVD 1: Issue Conversion Rate \u2014 "
-                    "MATSUlab Discourse Graph"
-                ),
-                "description": (
-                    "Evidence bundle for the finding that 29% of MATSUlab issues "
-                    "(n=445) were claimed as experiments and 38% of those produced "
-                    "at least one formal result node, yielding 139 total RES nodes. "
-                    "Contains the evidence statement, static and interactive figures, "
-                    "underlying data, and methodological documentation."
-                ),
-                "datePublished": "2026-02-14",
-                "creator": [
-                    {"@id": "#matt-akamatsu"},
-                ],
-                "license": {"@id": "https://creativecommons.org/licenses/by/4.0/"},
-                "hasPart": [
-                    {"@id": "evidence.jsonld"},
-                    {"@id": "figS1_issue_timeline.png"},
-                    {"@id": "figS1_issue_timeline.html"},
-                    {"@id": "figS1_issue_timeline_animated.gif"},
-                    {"@id": "fig1_conversion_rate.png"},
-                    {"@id": "fig1_conversion_rate.html"},
-                    {"@id": "data/conversion_data.json"},
-                    {"@id": "data/issue_timeline_data.json"},
-                    {"@id": "methods_excerpt.md"},
-                ],
-            },
-            {
-                "@id": "#matt-akamatsu",
-                "@type": "Person",
-                "name": "Matt Akamatsu",
-                "affiliation": {"@id": "#uw"},
-            },
-            {
-                "@id": "#uw",
-                "@type": "Organization",
-                "name": "University of Washington",
-            },
-            {
-                "@id": "evidence.jsonld",
-                "@type": "File",
-                "name": "Evidence Bundle Metadata (JSON-LD)",
-                "description": (
-                    "Canonical evidence bundle metadata using the dge: "
-                    "(Discourse Graph Evidence) vocabulary."
-                ),
-                "encodingFormat": "application/ld+json",
-            },
-            {
-                "@id": "figS1_issue_timeline.png",
-                "@type": ["File", "ImageObject"],
-                "name": "Figure S1: Issue Creation Timeline (static)",
-                "description": (
-                    "Cumulative issue creation over time with dual y-axis. "
-                    "Left axis: cumulative issue count (claimed vs unclaimed). "
-                    "Right axis: issues as percentage of total discourse nodes. "
-                    "Introductory panel contextualizing when and how the 445 issues accumulated."
-                ),
-                "encodingFormat": "image/png",
-            },
-            {
-                "@id": "figS1_issue_timeline.html",
-                "@type": ["File", "WebPage"],
-                "name": "Figure S1: Issue Creation Timeline (interactive)",
-                "description": (
-                    "Interactive Plotly version of the issue creation timeline. "
-                    "Hover for date and count details. Toggle between discourse node "
-                    "and all-content-page denominators for percentage calculation."
-                ),
-                "encodingFormat": "text/html",
-            },
-            {
-                "@id": "figS1_issue_timeline_animated.gif",
-                "@type": ["File", "ImageObject"],
-                "name": "Figure S1 (animated): Issue Creation Timeline",
-                "description": (
-                    "Animated GIF showing cumulative issue creation month by month, "
-                    "with running counter. Suitable for presentations."
-                ),
-                "encodingFormat": "image/gif",
-            },
-            {
-                "@id": "fig1_conversion_rate.png",
-                "@type": ["File", "ImageObject"],
-                "name": "Figure 1: Issue Conversion Rate (static)",
-                "description": (
-                    "Two-panel figure. Left: stacked horizontal bar showing 445 issues "
-                    "broken down by claiming type (69 explicitly, 56 inferred, 5 ISS with "
-                    "activity, 315 unclaimed). Right: donut chart of claiming authorship "
-                    "(106 self-claimed, 19 cross-person)."
-                ),
-                "encodingFormat": "image/png",
-            },
-            {
-                "@id": "fig1_conversion_rate.html",
-                "@type": ["File", "WebPage"],
-                "name": "Figure 1: Issue Conversion Rate (interactive)",
-                "description": (
-                    "Interactive HTML/JS version of Figure 1 with hover tooltips, "
-                    "animated transitions, and responsive layout. Self-contained "
-                    "single-file application."
-                ),
-                "encodingFormat": "text/html",
-            },
-            {
-                "@id": "data/conversion_data.json",
-                "@type": "File",
-                "name": "Conversion Rate Data",
-                "description": (
-                    "Aggregated conversion rate data with claiming type breakdown, "
-                    "authorship statistics, and result production metrics."
-                ),
-                "encodingFormat": "application/json",
-            },
-            {
-                "@id": "data/issue_timeline_data.json",
-                "@type": "File",
-                "name": "Issue Timeline Data",
-                "description": (
-                    "Per-issue creation dates, monthly summary with cumulative counts, "
-                    "and discourse node growth data by type. Supports Figure 0 visualizations."
-                ),
-                "encodingFormat": "application/json",
-            },
-            {
-                "@id": "methods_excerpt.md",
-                "@type": "File",
-                "name": "Methods Excerpt",
-                "description": (
-                    "Relevant sections from the full methods document covering "
-                    "node identification, claiming detection, and conversion rate calculation."
-                ),
-                "encodingFormat": "text/markdown",
-            },
-        ],
-    }
-
-    with open(path, 'w') as f:
-        json.dump(rocrate, f, indent=2, ensure_ascii=False)
+    write_atomic(path, _RO_CRATE_EVD1_BYTES)
 
 
 if __name__ == '__main__':
@@ -11,12 +11,14 @@ and results are always on the same axis.
 """
 
 from __future__ import annotations
-import json
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 import plotly.graph_objects as go
 
+from io_utils import load_json_file
+
 
 # ── colours ──────────────────────────────────────────────────────
 C_CLAIM      = '#2980b9'
@@ -27,6 +29,10 @@ BAR_SELF     = '#fff3e0'
 BAR_ANOMALY  = '#ffcdd2'
 
 
+# The same timestamps are formatted and parsed repeatedly (page_created
+# for every marker, ref_timestamp for every result), so both helpers are
+# memoized; datetimes are immutable, so sharing cached results is safe.
+@lru_cache(maxsize=None)
 def _fmt_dt(val: str | None) -> str:
     """Format an ISO timestamp for display."""
     if not val:
@@ -38,6 +44,7 @@ def _fmt_dt(val: str | None) -> str:
         return str(val)[:16]
 
 
+@lru_cache(maxsize=None)
 def _parse_dt(val: str | None) -> datetime | None:
     if not val:
         return None
@@ -67,8 +74,7 @@ def main():
     out_path = repo / 'output' / 'visualizations' / 'fig6c_swimmer_plot_diagnostic.html'
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(metrics_path) as f:
-        data = json.load(f)
+    data = load_json_file(metrics_path)
 
     ttr = data['metrics']['time_to_first_result']
     ttc = data['metrics']['time_to_claim']
@@ -87,37 +93,14 @@ def main():
     # Cross-person titles
     cross_titles = {cp['title'] for cp in conv.get('cross_person_claim_list', [])}
 
-    # ── Pre-compute page-origin days for sorting ────────────────
+    # ── Per-experiment derived fields, computed once ───────────
+    # Everything the render loop needs (page-axis days, anomaly flag, bar
+    # colour) is worked out here alongside the sort key.
     enriched = []
     for det in ttr['details']:
         title = det['experiment_title']
         claim_info = claim_lookup.get(title, {})
         exp_info = exp_lookup.get(title, {})
-
-        page_created_str = claim_info.get('page_created',
-                                          exp_info.get('page_created'))
-        page_dt = _parse_dt(page_created_str)
-
-        first_res_ts = det.get('first_res_created')
-        d_result_from_page = _days_from(page_dt, first_res_ts)
-
-        enriched.append({
-            'det': det,
-            'd_result_from_page': d_result_from_page if d_result_from_page is not None else 0,
-        })
-
-    # Sort by days-to-first-result-from-page descending (longest at top)
-    enriched.sort(key=lambda x: x['d_result_from_page'], reverse=True)
-    n = len(enriched)
-
-    fig = go.Figure()
-
-    for i, item in enumerate(enriched):
-        det = item['det']
-        y_pos = n - i
-        title = det['experiment_title']
-        claim_info = claim_lookup.get(title, {})
-        exp_info = exp_lookup.get(title, {})
         claim_type = exp_info.get('claim_type', 'unknown')
         is_cross = title in cross_titles
 
@@ -126,22 +109,11 @@ def main():
         page_dt = _parse_dt(page_created_str)
         claimed_ts_str = claim_info.get('claimed_timestamp',
                                         exp_info.get('claimed_by_timestamp'))
-        ref_ts_str = det.get('ref_timestamp')
         first_res_ts = det.get('first_res_created')
-        first_res_title = det.get('first_res_title', '—')
-        first_res_creator = det.get('first_res_creator', '—')
-        claimer = det.get('claimed_by', '—')
-        total_res = det.get('total_linked_res', 1)
-        first_log = exp_info.get('first_log_entry')
-        log_count = exp_info.get('log_entry_count', 0)
 
         # ── Unified page-origin days ────────────────────────────
         d_claim_page = _days_from(page_dt, claimed_ts_str)  # claim on page axis
         d_first_page = _days_from(page_dt, first_res_ts)    # 1st result on page axis
-        d_first_ref  = det['days_to_first_result']          # original (from ref_timestamp)
-        d_claim_orig = claim_info.get('days_to_claim')      # original claim days
-
-        ref_label = 'claimed_timestamp' if claim_type == 'explicit' else 'page_created'
 
         # Anomaly: result still before claim even on unified axis?
         anomaly = None
@@ -162,57 +134,102 @@ def main():
         elif not res_days_page:
             res_days_page = [0]
 
+        enriched.append({
+            'det': det,
+            'title': title,
+            'exp_info': exp_info,
+            'claim_type': claim_type,
+            'page_created_str': page_created_str,
+            'claimed_ts_str': claimed_ts_str,
+            'first_res_ts': first_res_ts,
+            'd_claim_page': d_claim_page,
+            'd_first_page': d_first_page,
+            'd_result_from_page': d_first_page if d_first_page is not None else 0,
+            'anomaly': anomaly,
+            'all_res': all_res,
+            'res_days_page': res_days_page,
+            'bar_color': BAR_ANOMALY if anomaly else (BAR_CROSS if is_cross else BAR_SELF),
+        })
+
+    # Sort by days-to-first-result-from-page descending (longest at top)
+    enriched.sort(key=lambda x: x['d_result_from_page'], reverse=True)
+    n = len(enriched)
+
+    # One trace per mark kind, filled point by point below; per-point
+    # colours and hover text live in parallel lists, so the figure holds
+    # four traces however many experiments and results there are.
+    bar_x, bar_y, bar_colors = [], [], []
+    claim_x, claim_y, claim_colors, claim_text = [], [], [], []
+    first_x, first_y, first_colors, first_text = [], [], [], []
+    later_x, later_y, later_text = [], [], []
+
+    for i, item in enumerate(enriched):
+        det = item['det']
+        y_pos = n - i
+        title = item['title']
+        exp_info = item['exp_info']
+        claim_type = item['claim_type']
+        page_created_str = item['page_created_str']
+        claimed_ts_str = item['claimed_ts_str']
+        first_res_ts = item['first_res_ts']
+        d_claim_page = item['d_claim_page']
+        d_first_page = item['d_first_page']
+        anomaly = item['anomaly']
+        all_res = item['all_res']
+        res_days_page = item['res_days_page']
+
+        ref_ts_str = det.get('ref_timestamp')
+        first_res_title = det.get('first_res_title', '—')
+        first_res_creator = det.get('first_res_creator', '—')
+        claimer = det.get('claimed_by', '—')
+        total_res = det.get('total_linked_res', 1)
+        first_log = exp_info.get('first_log_entry')
+        log_count = exp_info.get('log_entry_count', 0)
+
+        ref_label = 'claimed_timestamp' if claim_type == 'explicit' else 'page_created'
+        # Shared by the claim and every result hover of this experiment
+        title_short = _short(title, 70)
+        ref_dt = _parse_dt(ref_ts_str)
+        ref_note = f'(ref = {ref_label}: {_fmt_dt(ref_ts_str)})'
+
         # ── Background bar ──────────────────────────────────────
         extent_vals = list(res_days_page)
         if d_claim_page is not None:
             extent_vals.append(d_claim_page)
         last_day = max(extent_vals) if extent_vals else 0
 
-        bar_color = BAR_ANOMALY if anomaly else (BAR_CROSS if is_cross else BAR_SELF)
-
-        fig.add_trace(go.Bar(
-            x=[last_day], y=[y_pos],
-            orientation='h',
-            marker=dict(color=bar_color, line=dict(width=0)),
-            width=0.5,
-            showlegend=False,
-            hoverinfo='skip',
-        ))
+        bar_x.append(last_day)
+        bar_y.append(y_pos)
+        bar_colors.append(item['bar_color'])
 
         # ── Claim diamond (plotted at d_claim_page) ─────────────
         if d_claim_page is not None:
-            claim_hover = [
-                f'<b>◆ CLAIMED</b>',
-                f'<b>Title:</b> {_short(title, 70)}',
-                f'<b>Claimed by:</b> {claimer}',
-                f'<b>Claim type:</b> {claim_type}',
-                f'<b>Claim timestamp:</b> {_fmt_dt(claimed_ts_str)}',
-                f'<b>Page created:</b> {_fmt_dt(page_created_str)}',
-                f'<b>Days to claim (from page):</b> {d_claim_page}',
-            ]
+            claim_hover = (
+                f'<b>◆ CLAIMED</b><br>'
+                f'<b>Title:</b> {title_short}<br>'
+                f'<b>Claimed by:</b> {claimer}<br>'
+                f'<b>Claim type:</b> {claim_type}<br>'
+                f'<b>Claim timestamp:</b> {_fmt_dt(claimed_ts_str)}<br>'
+                f'<b>Page created:</b> {_fmt_dt(page_created_str)}<br>'
+                f'<b>Days to claim (from page):</b> {d_claim_page}'
+            )
             if claim_type == 'inferred':
-                claim_hover.append(f'<b>First log entry:</b> {_fmt_dt(first_log)}')
-                claim_hover.append(f'<b>Log entry count:</b> {log_count}')
-                claim_hover.append(
-                    '<b>Method:</b> no Claimed By:: field; '
+                claim_hover += (
+                    f'<br><b>First log entry:</b> {_fmt_dt(first_log)}'
+                    f'<br><b>Log entry count:</b> {log_count}'
+                    '<br><b>Method:</b> no Claimed By:: field; '
                     'claim inferred from first experimental log entry'
                 )
             if anomaly:
-                claim_hover.append(f'<b>⚠️ {anomaly}</b>')
-                claim_hover.append(
-                    f'<b>1st result day (page):</b> {d_first_page}'
+                claim_hover += (
+                    f'<br><b>⚠️ {anomaly}</b>'
+                    f'<br><b>1st result day (page):</b> {d_first_page}'
                 )
 
-            fig.add_trace(go.Scatter(
-                x=[d_claim_page], y=[y_pos],
-                mode='markers',
-                marker=dict(symbol='diamond', size=10,
-                            color='#c62828' if anomaly else C_CLAIM,
-                            line=dict(width=1, color='white')),
-                text='<br>'.join(claim_hover),
-                hoverinfo='text',
-                showlegend=False,
-            ))
+            claim_x.append(d_claim_page)
+            claim_y.append(y_pos)
+            claim_colors.append('#c62828' if anomaly else C_CLAIM)
+            claim_text.append(claim_hover)
 
         # ── Result marks (plotted at res_days_page) ─────────────
         for j, rd_page in enumerate(res_days_page):
@@ -223,42 +240,75 @@ def main():
             r_creator = r_info.get('creator', first_res_creator if is_first else '—')
 
             # Also compute days from ref_timestamp for comparison
-            r_days_from_ref = _days_from(_parse_dt(ref_ts_str), r_created)
-
-            res_hover = [
-                f'<b>{"★ 1ST RESULT" if is_first else f"● RESULT {j+1}"}</b>',
-                f'<b>Exp:</b> {_short(title, 70)}',
-                f'<b>Res title:</b> {_short(str(r_title), 80)}',
-                f'<b>Result created:</b> {_fmt_dt(r_created)}',
-                f'<b>Result creator:</b> {r_creator}',
-                f'<b>Days from page_created:</b> {rd_page}',
-                f'<b>Days from ref_timestamp:</b> {r_days_from_ref}  '
-                f'(ref = {ref_label}: {_fmt_dt(ref_ts_str)})',
-                f'<b>Claim day (page):</b> {d_claim_page}',
-                f'<b>Total linked RES:</b> {total_res}',
-            ]
+            r_days_from_ref = _days_from(ref_dt, r_created)
+
+            res_hover = (
+                f'<b>{"★ 1ST RESULT" if is_first else f"● RESULT {j+1}"}</b><br>'
+                f'<b>Exp:</b> {title_short}<br>'
+                f'<b>Res title:</b> {_short(str(r_title), 80)}<br>'
+                f'<b>Result created:</b> {_fmt_dt(r_created)}<br>'
+                f'<b>Result creator:</b> {r_creator}<br>'
+                f'<b>Days from page_created:</b> {rd_page}<br>'
+                f'<b>Days from ref_timestamp:</b> {r_days_from_ref}  {ref_note}<br>'
+                f'<b>Claim day (page):</b> {d_claim_page}<br>'
+                f'<b>Total linked RES:</b> {total_res}'
+            )
             if anomaly and is_first:
-                res_hover.append(f'<b>⚠️ {anomaly}</b>')
+                res_hover += f'<br><b>⚠️ {anomaly}</b>'
                 if claim_type == 'inferred':
-                    res_hover.append(
-                        '<b>Note:</b> claim inferred from first_log_entry; '
+                    res_hover += (
+                        '<br><b>Note:</b> claim inferred from first_log_entry; '
                         f'log was {_fmt_dt(first_log)}, after result'
                     )
 
-            fig.add_trace(go.Scatter(
-                x=[rd_page], y=[y_pos],
-                mode='markers',
-                marker=dict(
-                    symbol='star' if is_first else 'circle',
-                    size=11 if is_first else 7,
-                    color=('#c62828' if anomaly and is_first else
-                           C_RESULT_1ST if is_first else C_RESULT_N),
-                    line=dict(width=1, color='white'),
-                ),
-                text='<br>'.join(res_hover),
-                hoverinfo='text',
-                showlegend=False,
-            ))
+            if is_first:
+                first_x.append(rd_page)
+                first_y.append(y_pos)
+                first_colors.append('#c62828' if anomaly else C_RESULT_1ST)
+                first_text.append(res_hover)
+            else:
+                later_x.append(rd_page)
+                later_y.append(y_pos)
+                later_text.append(res_hover)
+
+    # Bars underneath, then claims, then results on top
+    fig = go.Figure([
+        go.Bar(
+            x=bar_x, y=bar_y,
+            orientation='h',
+            marker=dict(color=bar_colors, line=dict(width=0)),
+            width=0.5,
+            showlegend=False,
+            hoverinfo='skip',
+        ),
+        go.Scatter(
+            x=claim_x, y=claim_y,
+            mode='markers',
+            marker=dict(symbol='diamond', size=10, color=claim_colors,
+                        line=dict(width=1, color='white')),
+            text=claim_text,
+            hoverinfo='text',
+            showlegend=False,
+        ),
+        go.Scatter(
+            x=first_x, y=first_y,
+            mode='markers',
+            marker=dict(symbol='star', size=11, color=first_colors,
+                        line=dict(width=1, color='white')),
+            text=first_text,
+            hoverinfo='text',
+            showlegend=False,
+        ),
+        go.Scatter(
+            x=later_x, y=later_y,
+            mode='markers',
+            marker=dict(symbol='circle', size=7, color=C_RESULT_N,
+                        line=dict(width=1, color='white')),
+            text=later_text,
+            hoverinfo='text',
+            showlegend=False,
+        ),
+    ])
 
     # ── Y-axis labels: experiment titles ────────────────────────
     y_labels = [_short(item['det']['experiment_title'], 45) for item in enriched]
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Freeze the Name Mapping
+=======================
+Bakes ``name_mapping.json`` and the lookup tables derived from it into
+``_name_mapping_gen.py`` as plain dict literals. ``anonymize.py`` imports
+that module when it exists, so the mapping is loaded straight from the
+compiled ``.pyc`` with no JSON parsing or table building at import.
+
+The generated file contains real researcher names and is gitignored.
+Re-run this script whenever ``name_mapping.json`` changes.
+
+Usage:
+    python src/freeze_name_mapping.py
+
+Author: Matt Akamatsu (with Claude)
+Date: 2026-02-12
+"""
+
+import sys
+from pathlib import Path
+from pprint import pformat
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import anonymize
+
+OUTPUT_PATH = Path(__file__).parent / '_name_mapping_gen.py'
+
+
+def freeze_mapping(output_path: Path = OUTPUT_PATH) -> Path:
+    """Write the current name mapping and derived tables as a Python module."""
+    # Rebuild from name_mapping.json, ignoring any previously frozen module
+    anonymize.refresh()
+    title_pattern = anonymize._TITLE_RE.pattern if anonymize._TITLE_RE else None
+
+    lines = [
+        '"""Generated by freeze_name_mapping.py from name_mapping.json. Do not edit."""',
+        '',
+        f'NAME_TO_PSEUDONYM = {pformat(anonymize.NAME_TO_PSEUDONYM, sort_dicts=False)}',
+        '',
+        f'LAST_NAME_INDEX = {pformat(anonymize._LAST_NAME_INDEX, sort_dicts=False)}',
+        '',
+        f'FIRST_NAME_MAP = {pformat(anonymize._FIRST_NAME_MAP, sort_dicts=False)}',
+        '',
+        f'TITLE_REPLACEMENTS = {pformat(anonymize._TITLE_REPLACEMENTS, sort_dicts=False)}',
+        '',
+        f'TITLE_PATTERN = {title_pattern!r}',
+        '',
+    ]
+    output_path.write_text('\n'.join(lines), encoding='utf-8')
+    return output_path
+
+
+if __name__ == '__main__':
+    path = freeze_mapping()
+    print(f"Frozen name mapping written to: {path}")
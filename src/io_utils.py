@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Shared File I/O Helpers
+=======================
+JSON encoding/decoding and atomic file writes shared by the parsers, the
+metrics pipeline and the evidence bundle generator, kept in one place so
+they cannot drift apart.
+
+orjson is used when installed (see requirements.txt); otherwise the
+stdlib json module produces the same output.
+
+Author: Matt Akamatsu (with Claude)
+Date: 2026-02-12
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Stdlib encoders for the no-orjson path, built once rather than per call.
+# (',', ': ') is what json uses with indent anyway; spelled out so the
+# output format does not depend on that default.
+_PRETTY_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, separators=(',', ': '))
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def load_json_bytes(raw: bytes) -> Any:
+    """Parse a JSON document from bytes, with orjson when available."""
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def load_json_file(path) -> Any:
+    """Read and parse a whole JSON file."""
+    with open(path, 'rb') as f:
+        return load_json_bytes(f.read())
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Encode obj as UTF-8 JSON bytes, with orjson when available.
+
+    Both backends keep non-ASCII text as-is and turn non-string dict keys
+    into strings, so the bytes do not depend on which one is installed.
+    Only orjson serializes datetime objects; convert them first if orjson
+    may be missing.
+
+    Args:
+        obj: JSON-serializable object
+        pretty: Indent with 2 spaces; compact by default
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    encoder = _PRETTY_ENCODER if pretty else _COMPACT_ENCODER
+    return encoder.encode(obj).encode('utf-8')
+
+
+def write_atomic(path, payload: bytes) -> None:
+    """
+    Write payload to a temporary sibling and rename it over path.
+
+    Readers never see a partly written file, even if a run is interrupted
+    or another process writes the same output concurrently. If path
+    already holds exactly payload (a rebuild with unchanged data), nothing
+    is written.
+
+    Args:
+        path: Destination file path
+        payload: Complete file contents
+    """
+    path = Path(path)
+    try:
+        if path.stat().st_size == len(payload) and path.read_bytes() == payload:
+            return
+    except FileNotFoundError:
+        pass
+    # Per-process name, so concurrent runs do not share a temp file
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -13,7 +13,6 @@ Author: Matt Akamatsu (with Claude)
 Date: 2026-01-25
 """
 
-import json
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -21,7 +20,7 @@ from pathlib import Path
 # Add src directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from calculate_metrics import calculate_all_metrics, print_metrics_summary
+from calculate_metrics import calculate_all_metrics, print_metrics_summary, save_metrics
 from generate_visualizations import generate_all_visualizations
 from handoff_visualizations import generate_all_handoff_visualizations
 from create_evidence_bundle import create_evd1_bundle, create_evd5_bundle
@@ -300,14 +299,8 @@ def run_pipeline(
     print("STEP 4: Saving metrics data...")
     print("-" * 40)
 
-    def json_serializer(obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
-
     metrics_json_path = output_dir / 'metrics_data.json'
-    with open(metrics_json_path, 'w') as f:
-        json.dump(metrics, f, indent=2, default=json_serializer)
+    save_metrics(metrics, metrics_json_path)
     print(f"Saved: {metrics_json_path}")
 
     # Step 5: Generate visualizations
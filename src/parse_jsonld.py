@@ -9,17 +9,17 @@ Author: Matt Akamatsu (with Claude)
 Date: 2026-01-25
 """
 
-import json
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+from io_utils import load_json_file
 
 
 def load_jsonld(filepath: str) -> dict:
     """Load and parse the JSON-LD file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return load_json_file(filepath)
 
 
 def get_graph_nodes(data: dict) -> list[dict]:
@@ -27,6 +27,23 @@ def get_graph_nodes(data: dict) -> list[dict]:
     return data.get('@graph', [])
 
 
+def iter_graph_nodes(filepath: str) -> Iterator[dict]:
+    """
+    Stream nodes from the @graph array without loading the whole document.
+
+    Uses ijson when available so the raw export is never held in memory
+    as one parsed object; falls back to a full load otherwise.
+    """
+    try:
+        import ijson
+    except ImportError:
+        yield from get_graph_nodes(load_jsonld(filepath))
+        return
+
+    with open(filepath, 'rb') as f:
+        yield from ijson.items(f, '@graph.item', use_float=True)
+
+
 def extract_nodes_by_type(graph: list[dict], node_type: str) -> list[dict]:
     """
     Filter nodes by their discourse type.
@@ -337,14 +354,16 @@ def analyze_graph(filepath: str) -> dict:
     - all_nodes_by_type: Dict mapping node type to list of nodes
     - relations: List of relation definitions
     """
-    data = load_jsonld(filepath)
-    graph = get_graph_nodes(data)
-
-    # Filter out schema definitions (nodeSchema, relationDef)
-    content_nodes = [
-        n for n in graph
-        if n.get('@type') not in ('nodeSchema', 'relationDef', 'relationInstance')
-    ]
+    # Single streaming pass: route relation nodes aside and filter out
+    # schema definitions (nodeSchema, relationDef, relationInstance)
+    content_nodes = []
+    relation_nodes = []
+    for node in iter_graph_nodes(filepath):
+        node_type = node.get('@type')
+        if node_type in ('relationDef', 'relationInstance'):
+            relation_nodes.append(node)
+        elif node_type != 'nodeSchema':
+            content_nodes.append(node)
 
     # Extract experiment pages
     experiment_pages = []
@@ -371,8 +390,8 @@ def analyze_graph(filepath: str) -> dict:
         all_nodes_by_type[node_type] = [extract_node_metadata(n) for n in nodes]
 
     # Get relations
-    relations = get_relation_definitions(graph)
-    relation_instances = get_relation_instances(graph)
+    relations = get_relation_definitions(relation_nodes)
+    relation_instances = get_relation_instances(relation_nodes)
 
     return {
         'experiment_pages': experiment_pages,
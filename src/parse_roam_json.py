@@ -11,12 +11,13 @@ Author: Matt Akamatsu (with Claude)
 Date: 2026-01-25
 """
 
-import json
 import re
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Iterator
 
+from io_utils import load_json_file
+
 
 def load_roam_json_streaming(filepath: str) -> Iterator[dict]:
     """
@@ -32,16 +33,12 @@ def load_roam_json_streaming(filepath: str) -> Iterator[dict]:
     except ImportError:
         # Fallback to loading entire file if ijson not available
         print("Warning: ijson not installed, loading entire file into memory")
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            for page in data:
-                yield page
+        yield from load_roam_json(filepath)
 
 
 def load_roam_json(filepath: str) -> list[dict]:
     """Load entire Roam JSON export into memory."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return load_json_file(filepath)
 
 
 def find_page_by_title(pages: list[dict], title: str) -> Optional[dict]:
@@ -395,7 +392,11 @@ def extract_timestamps_for_experiments(filepath: str, experiment_titles: list[st
     return results
 
 
-def validate_roam_export(filepath: str, jsonld_data: dict, min_match_rate: float = 0.5) -> dict:
+def validate_roam_export(
+    filepath: str,
+    jsonld_data: dict,
+    min_match_rate: float = 0.5,
+) -> dict:
     """
     Validate that a Roam JSON export comes from the same graph as the JSON-LD export.
 
@@ -415,9 +416,6 @@ def validate_roam_export(filepath: str, jsonld_data: dict, min_match_rate: float
     Raises:
         ValueError: If match rate is below min_match_rate
     """
-    jsonld_exp_titles = {e['title'] for e in jsonld_data.get('experiment_pages', [])}
-    jsonld_iss_titles = {i['title'] for i in jsonld_data.get('iss_nodes', [])}
-
     roam_exp_titles = set()
     roam_iss_titles = set()
     total_roam_pages = 0
@@ -430,6 +428,22 @@ def validate_roam_export(filepath: str, jsonld_data: dict, min_match_rate: float
         if '[[ISS]]' in title:
             roam_iss_titles.add(title)
 
+    return _check_roam_titles(
+        jsonld_data, roam_exp_titles, roam_iss_titles, total_roam_pages, min_match_rate,
+    )
+
+
+def _check_roam_titles(
+    jsonld_data: dict,
+    roam_exp_titles: set,
+    roam_iss_titles: set,
+    total_roam_pages: int,
+    min_match_rate: float,
+) -> dict:
+    """Match Roam page titles against the JSON-LD export; see validate_roam_export()."""
+    jsonld_exp_titles = {e['title'] for e in jsonld_data.get('experiment_pages', [])}
+    jsonld_iss_titles = {i['title'] for i in jsonld_data.get('iss_nodes', [])}
+
     exp_matched = len(jsonld_exp_titles & roam_exp_titles)
     iss_matched = len(jsonld_iss_titles & roam_iss_titles)
     total_jsonld = len(jsonld_exp_titles) + len(jsonld_iss_titles)
@@ -461,6 +475,29 @@ def validate_roam_export(filepath: str, jsonld_data: dict, min_match_rate: float
     return result
 
 
+def _analyze_experiment_page(page: dict) -> dict:
+    """Extract timestamps and attribution fields from one experiment page."""
+    log_entries = get_experimental_log_entries(page)
+
+    first_log_entry = None
+    if log_entries:
+        timestamps = [e['timestamp'] for e in log_entries if e['timestamp']]
+        if timestamps:
+            first_log_entry = min(timestamps)
+
+    return {
+        'page_created': get_page_creation_time(page),
+        'earliest_block_timestamp': get_earliest_block_timestamp(page),
+        'claimed_by': extract_claimed_by_timestamp(page),
+        'issue_created_by': extract_issue_created_by_timestamp(page),
+        'made_by': extract_made_by_timestamp(page),
+        'author': extract_author_from_page(page),
+        'has_experimental_log': has_experimental_log(page),
+        'first_log_entry': first_log_entry,
+        'log_entry_count': len(log_entries),
+    }
+
+
 def analyze_all_experiment_pages(filepath: str) -> dict:
     """
     Analyze all experiment pages (titles starting with @) in the Roam export.
@@ -476,34 +513,29 @@ def analyze_all_experiment_pages(filepath: str) -> dict:
         if not title.startswith('@'):
             continue
 
-        page_created = get_page_creation_time(page)
-        earliest_block = get_earliest_block_timestamp(page)
-        claimed_by = extract_claimed_by_timestamp(page)
-        issue_created_by = extract_issue_created_by_timestamp(page)
-        made_by = extract_made_by_timestamp(page)
-        author = extract_author_from_page(page)
-        has_log = has_experimental_log(page)
-        log_entries = get_experimental_log_entries(page)
+        results[title] = _analyze_experiment_page(page)
 
-        first_log_entry = None
-        if log_entries:
-            timestamps = [e['timestamp'] for e in log_entries if e['timestamp']]
-            if timestamps:
-                first_log_entry = min(timestamps)
+    return results
 
-        results[title] = {
-            'page_created': page_created,
-            'earliest_block_timestamp': earliest_block,
-            'claimed_by': claimed_by,
-            'issue_created_by': issue_created_by,
-            'made_by': made_by,
-            'author': author,
-            'has_experimental_log': has_log,
-            'first_log_entry': first_log_entry,
-            'log_entry_count': len(log_entries),
-        }
 
-    return results
+def _analyze_iss_page(page: dict) -> dict:
+    """Extract timestamps and attribution fields from one ISS page."""
+    log_entries = get_experimental_log_entries(page)
+
+    first_log_entry = None
+    if log_entries:
+        timestamps = [e['timestamp'] for e in log_entries if e['timestamp']]
+        if timestamps:
+            first_log_entry = min(timestamps)
+
+    return {
+        'page_created': get_page_creation_time(page),
+        'made_by': extract_made_by_timestamp(page),
+        'author': extract_author_from_page(page),
+        'has_experimental_log': has_experimental_log(page),
+        'first_log_entry': first_log_entry,
+        'log_entry_count': len(log_entries),
+    }
 
 
 def analyze_iss_pages(filepath: str) -> dict:
@@ -521,28 +553,63 @@ def analyze_iss_pages(filepath: str) -> dict:
         if '[[ISS]]' not in title:
             continue
 
-        page_created = get_page_creation_time(page)
-        made_by = extract_made_by_timestamp(page)
-        author = extract_author_from_page(page)
-        has_log = has_experimental_log(page)
-        log_entries = get_experimental_log_entries(page)
+        results[title] = _analyze_iss_page(page)
 
-        first_log_entry = None
-        if log_entries:
-            timestamps = [e['timestamp'] for e in log_entries if e['timestamp']]
-            if timestamps:
-                first_log_entry = min(timestamps)
+    return results
 
-        results[title] = {
-            'page_created': page_created,
-            'made_by': made_by,
-            'author': author,
-            'has_experimental_log': has_log,
-            'first_log_entry': first_log_entry,
-            'log_entry_count': len(log_entries),
-        }
 
-    return results
+def analyze_roam_pages(
+    filepath: str,
+    jsonld_data: dict = None,
+    min_match_rate: float = 0.5,
+) -> dict:
+    """
+    Analyze experiment and ISS pages in a single streaming pass.
+
+    Equivalent to calling analyze_all_experiment_pages() and
+    analyze_iss_pages(), but reads the (large) export only once. If
+    jsonld_data is given, the export is also checked as validate_roam_export()
+    does, before any per-page extraction, so an export from the wrong graph
+    fails without paying for it.
+
+    Returns dict with:
+    - experiment_pages: as returned by analyze_all_experiment_pages()
+    - iss_pages: as returned by analyze_iss_pages()
+    - total_pages: number of pages in the export
+    - validation: as returned by validate_roam_export(), or None without
+      jsonld_data
+
+    Raises:
+        ValueError: If jsonld_data is given and the match rate is below
+                    min_match_rate
+    """
+    # The pass only picks out the relevant pages; extraction waits until
+    # the titles have been validated
+    exp_pages = {}
+    iss_pages = {}
+    total_pages = 0
+
+    for page in load_roam_json_streaming(filepath):
+        title = page.get('title', '')
+        total_pages += 1
+
+        if title.startswith('@'):
+            exp_pages[title] = page
+        if '[[ISS]]' in title:
+            iss_pages[title] = page
+
+    validation = None
+    if jsonld_data is not None:
+        validation = _check_roam_titles(
+            jsonld_data, set(exp_pages), set(iss_pages), total_pages, min_match_rate,
+        )
+
+    return {
+        'experiment_pages': {t: _analyze_experiment_page(p) for t, p in exp_pages.items()},
+        'iss_pages': {t: _analyze_iss_page(p) for t, p in iss_pages.items()},
+        'total_pages': total_pages,
+        'validation': validation,
+    }
 
 
 if __name__ == '__main__':
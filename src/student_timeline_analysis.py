@@ -693,8 +693,9 @@ def save_milestones_json(student_data: dict, output_path: Path):
         'note': 'Researcher identities anonymized in visualizations',
     }
 
+    # Encode once and write once, rather than one write per encoder chunk
     with open(output_path, 'w') as f:
-        json.dump(milestones, f, indent=2)
+        f.write(json.dumps(milestones, indent=2))
 
     print(f"  Saved: {output_path}")
 